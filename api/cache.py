@@ -0,0 +1,313 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Protocol
+
+import numpy as np
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from api.database import HISTORY_CHANNEL, Memory, async_engine
+from api.metrics import registry
+from api.utils import env_bool
+
+CACHE_ENABLED = env_bool("CACHE_ENABLED", True)
+# "memory" keeps entries in this process, "sqlite" shares them between workers on the same host
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+# kept out of /tmp so other local users can't plant or read the file
+CACHE_PATH = os.getenv(
+    "CACHE_PATH",
+    os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "terabyte", "cache.sqlite3"),
+)
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "2048"))
+EMBEDDING_CACHE_TTL = float(os.getenv("EMBEDDING_CACHE_TTL", "86400"))
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "512"))
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "300"))
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> dict:
+        total = self.hits + self.misses
+        return {**asdict(self), "hit_ratio": self.hits / total if total else 0.0}
+
+
+class CacheBackend(Protocol):
+    stats: CacheStats
+
+    def get(self, key: str) -> Any | None: ...
+
+    def set(self, key: str, value: Any): ...
+
+    def generation(self) -> int: ...
+
+    def invalidate(self): ...
+
+    def __len__(self) -> int: ...
+
+
+class MemoryCacheBackend:
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            self.stats.sets += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def generation(self) -> int:
+        return self._generation
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.stats.invalidations += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# values are stored as raw bytes or JSON text, never pickled, so reading the file can't run code
+def encode_value(value: Any) -> bytes | str:
+    return value if isinstance(value, bytes) else json.dumps(value)
+
+
+def decode_value(value: bytes | str) -> Any:
+    return value if isinstance(value, bytes) else json.loads(value)
+
+
+class SQLiteCacheBackend:
+    def __init__(self, path: str, namespace: str, max_entries: int, ttl: float):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", mode=0o700, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache_values ("
+            "namespace TEXT, key TEXT, value BLOB, expires REAL, accessed REAL, PRIMARY KEY (namespace, key))"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS cache_values_accessed ON cache_values (namespace, accessed)")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS cache_generations (namespace TEXT PRIMARY KEY, value INTEGER)")
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM cache_values WHERE namespace = ? AND key = ? AND expires >= ?",
+                (self.namespace, key, now),
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE cache_values SET accessed = ? WHERE namespace = ? AND key = ?", (now, self.namespace, key)
+            )
+        self.stats.hits += 1
+        return decode_value(row[0])
+
+    def set(self, key: str, value: Any):
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_values VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, encode_value(value), now + self.ttl, now),
+            )
+            evicted = self._connection.execute(
+                "DELETE FROM cache_values WHERE namespace = ? AND (expires < ? OR key IN ("
+                "SELECT key FROM cache_values WHERE namespace = ? ORDER BY accessed DESC LIMIT -1 OFFSET ?))",
+                (self.namespace, now, self.namespace, self.max_entries),
+            ).rowcount
+        self.stats.sets += 1
+        self.stats.evictions += evicted
+
+    def generation(self) -> int:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM cache_generations WHERE namespace = ?", (self.namespace,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def invalidate(self):
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO cache_generations VALUES (?, 1) "
+                "ON CONFLICT (namespace) DO UPDATE SET value = value + 1",
+                (self.namespace,),
+            )
+            self._connection.execute("DELETE FROM cache_values WHERE namespace = ?", (self.namespace,))
+        self.stats.invalidations += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT count(*) FROM cache_values WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+
+
+def make_backend(namespace: str, max_entries: int, ttl: float) -> CacheBackend:
+    if CACHE_BACKEND == "memory":
+        return MemoryCacheBackend(max_entries, ttl)
+    if CACHE_BACKEND == "sqlite":
+        return SQLiteCacheBackend(CACHE_PATH, namespace, max_entries, ttl)
+    raise ValueError(f"unknown cache backend: {CACHE_BACKEND}")
+
+
+def content_hash(*parts: str | bytes) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode() if isinstance(part, str) else part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class EmbeddingCache:
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+
+    def get(self, model: str, content: str) -> np.ndarray | None:
+        value = self.backend.get(content_hash(model, content))
+        return None if value is None else np.frombuffer(value, dtype=np.float32)
+
+    def set(self, model: str, content: str, vector: np.ndarray):
+        self.backend.set(content_hash(model, content), np.asarray(vector, dtype=np.float32).tobytes())
+
+
+class SearchResultCache:
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+
+    def key(self, query_vector, limit: int, max_distance: float, **options) -> str:
+        vector_bytes = np.asarray(query_vector, dtype=np.float32).tobytes()
+        settings = ",".join(f"{name}={value}" for name, value in sorted(options.items()))
+        # the generation changes whenever history is written, so stale keys just stop matching
+        return content_hash(vector_bytes, f"{limit}:{max_distance}:{settings}:{self.backend.generation()}")
+
+    def get(self, key: str) -> list[tuple[str, str, float]] | None:
+        return self.backend.get(key)
+
+    def set(self, key: str, items: list[tuple[str, str, float]]):
+        self.backend.set(key, items)
+
+    def invalidate(self):
+        self.backend.invalidate()
+
+
+class CachedEmbedder:
+    def __init__(self, embedder, cache: EmbeddingCache):
+        self.embedder = embedder
+        self.cache = cache
+        self.model = embedder.model
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        cached = [self.cache.get(self.model, content) for content in texts]
+        missing = [index for index, vector in enumerate(cached) if vector is None]
+
+        if missing:
+            vectors = self.embedder.embed([texts[index] for index in missing])
+            for index, vector in zip(missing, vectors):
+                self.cache.set(self.model, texts[index], vector)
+                cached[index] = vector
+
+        return np.stack(cached).astype(np.float32, copy=False)
+
+
+embedding_cache = EmbeddingCache(make_backend("embeddings", EMBEDDING_CACHE_SIZE, EMBEDDING_CACHE_TTL))
+search_cache = SearchResultCache(make_backend("search", SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL))
+
+
+def invalidate_search_cache():
+    search_cache.invalidate()
+
+
+def cache_stats() -> dict:
+    return {
+        "enabled": CACHE_ENABLED,
+        "backend": CACHE_BACKEND,
+        "embeddings": {"entries": len(embedding_cache.backend), **embedding_cache.backend.stats.as_dict()},
+        "search": {"entries": len(search_cache.backend), **search_cache.backend.stats.as_dict()},
+    }
+
+
+# flush runs before commit, so it only marks the session and the invalidation waits for the commit;
+# invalidating earlier would let a concurrent search cache results without the uncommitted rows
+@event.listens_for(Session, "after_flush")
+def _mark_history_write(session, flush_context):
+    if any(isinstance(instance, Memory) for instance in (*session.new, *session.dirty, *session.deleted)):
+        session.info["history_written"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    if session.info.pop("history_written", False):
+        invalidate_search_cache()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_write(session):
+    session.info.pop("history_written", None)
+
+
+@asynccontextmanager
+async def invalidation_listener() -> AsyncIterator[None]:
+    # a trigger on history notifies HISTORY_CHANNEL on every committed write, from any process,
+    # so ingestion CLIs and other workers invalidate this process's cache too
+    async with async_engine.connect() as connection:
+        driver_connection = (await connection.get_raw_connection()).driver_connection
+
+        def on_notify(*args):
+            invalidate_search_cache()
+
+        await driver_connection.add_listener(HISTORY_CHANNEL, on_notify)
+        try:
+            yield
+        finally:
+            await driver_connection.remove_listener(HISTORY_CHANNEL, on_notify)
+
+
+@registry.collector
+def _cache_metrics():
+    tiers = {"embeddings": embedding_cache.backend, "search": search_cache.backend}
+    for field in ("hits", "misses", "sets", "evictions", "invalidations"):
+        name = f"cache_{field}_total"
+        yield f"# HELP {name} Cache {field} per tier"
+        yield f"# TYPE {name} counter"
+        for tier, backend in tiers.items():
+            yield f'{name}{{tier="{tier}"}} {getattr(backend.stats, field)}'
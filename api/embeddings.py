@@ -0,0 +1,61 @@
+import hashlib
+import os
+from typing import Protocol
+
+import numpy as np
+
+from api.cache import CACHE_ENABLED, CachedEmbedder, embedding_cache
+from api.database import VECTOR_DIMENSIONS
+
+# "hash" vectors are fake, it has to be asked for explicitly so they never end up in history by accident
+EMBEDDER = os.getenv("EMBEDDER", "openai")
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-large")
+
+
+class Embedder(Protocol):
+    model: str
+
+    def embed(self, texts: list[str]) -> np.ndarray: ...
+
+
+# deterministic local stand-in for tests: the same text always maps to the same unit vector
+class HashEmbedder:
+    def __init__(self, dimensions: int = VECTOR_DIMENSIONS):
+        self.dimensions = dimensions
+        self.model = f"hash-{dimensions}"
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        vectors = np.empty((len(texts), self.dimensions), dtype=np.float32)
+        for row, content in enumerate(texts):
+            seed = int.from_bytes(hashlib.sha256(content.encode()).digest()[:8], "little")
+            vectors[row] = np.random.default_rng(seed).standard_normal(self.dimensions, dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+
+class OpenAIEmbedder:
+    def __init__(self, model: str = EMBEDDING_MODEL, dimensions: int = VECTOR_DIMENSIONS):
+        from openai import OpenAI
+
+        self.client = OpenAI()
+        self.model = model
+        self.dimensions = dimensions
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        response = self.client.embeddings.create(model=self.model, input=texts, dimensions=self.dimensions)
+        data = sorted(response.data, key=lambda item: item.index)
+        return np.array([item.embedding for item in data], dtype=np.float32)
+
+
+def get_embedder(name: str | None = None, cached: bool = True) -> Embedder:
+    name = name or EMBEDDER
+    if name == "hash":
+        embedder = HashEmbedder()
+    elif name == "openai":
+        embedder = OpenAIEmbedder()
+    else:
+        raise ValueError(f"unknown embedder: {name}")
+
+    if cached and CACHE_ENABLED:
+        return CachedEmbedder(embedder, embedding_cache)
+    return embedder
@@ -0,0 +1,244 @@
+import argparse
+import io
+import json
+import logging
+import os
+import struct
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import batched
+from typing import Iterable, Iterator, NamedTuple
+
+import numpy as np
+from psycopg2.extras import execute_values
+from ulid import ulid
+
+from api.cache import invalidate_search_cache
+from api.database import DEFAULT_USER_ID, engine
+from api.embeddings import Embedder, get_embedder
+
+logger = logging.getLogger(__name__)
+
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "256"))
+INGEST_METHOD = os.getenv("INGEST_METHOD", "copy")
+
+COLUMNS = "id, user_id, conversation_id, created_at, content, \"vector\""
+INSERT_QUERY = f"INSERT INTO history ({COLUMNS}) VALUES %s"
+COPY_QUERY = f"COPY history ({COLUMNS}) FROM STDIN WITH (FORMAT binary)"
+PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+PGCOPY_TRAILER = struct.pack("!h", -1)
+PGCOPY_NULL = struct.pack("!i", -1)
+# binary timestamps are microseconds since the postgres epoch
+POSTGRES_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+class IngestRow(NamedTuple):
+    content: str
+    user_id: str = DEFAULT_USER_ID
+    conversation_id: str | None = None
+    created_at: datetime | None = None
+
+
+@dataclass
+class IngestReport:
+    rows: int = 0
+    batches: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "batches": self.batches,
+            "skipped": self.skipped,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+class IngestError(ValueError):
+    # raised for a malformed record; batches before it are already committed and counted in report
+    def __init__(self, message: str, report: IngestReport):
+        super().__init__(message)
+        self.report = report
+
+
+def optional_text(record: dict, key: str) -> str | None:
+    value = record.get(key)
+    if value is not None and not isinstance(value, str):
+        raise TypeError(f"{key} must be a string, got {type(value).__name__}")
+    return value
+
+
+def record_text(record: dict) -> str | None:
+    content = optional_text(record, "content")
+    if content:
+        return content
+
+    # requests.jsonl style records: {"request_id", "title", "body"}
+    parts = [optional_text(record, key) for key in ("title", "body")]
+    return "\n\n".join(part for part in parts if part) or None
+
+
+def parse_created_at(value: str | None) -> datetime | None:
+    if value is None:
+        return None
+    created_at = datetime.fromisoformat(value)
+    return created_at if created_at.tzinfo else created_at.replace(tzinfo=timezone.utc)
+
+
+def read_rows(lines: Iterable[str | bytes], report: IngestReport) -> Iterator[IngestRow]:
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            content = record_text(record)
+            user_id = optional_text(record, "user_id")
+            conversation_id = optional_text(record, "conversation_id")
+            created_at = parse_created_at(optional_text(record, "created_at"))
+        except (json.JSONDecodeError, AttributeError, TypeError, ValueError) as error:
+            raise IngestError(f"invalid JSONL record on line {number}: {error}", report) from error
+        if content is None:
+            report.skipped += 1
+            continue
+        yield IngestRow(content, user_id or DEFAULT_USER_ID, conversation_id, created_at)
+
+
+def write_copy_text(buffer: io.BytesIO, value: str | None):
+    if value is None:
+        buffer.write(PGCOPY_NULL)
+        return
+    data = value.encode()
+    buffer.write(struct.pack("!i", len(data)))
+    buffer.write(data)
+
+
+def encode_copy_batch(ids: list[str], rows: list[IngestRow], vectors: np.ndarray) -> bytes:
+    vectors = np.asarray(vectors, dtype=">f4")
+    vector_header = struct.pack("!HH", vectors.shape[1], 0)
+    vector_size = len(vector_header) + vectors.shape[1] * 4
+    now = datetime.now(timezone.utc)
+
+    buffer = io.BytesIO()
+    buffer.write(PGCOPY_HEADER)
+    for memory_id, row, vector in zip(ids, rows, vectors):
+        created_at = (row.created_at or now) - POSTGRES_EPOCH
+        buffer.write(struct.pack("!h", 6))
+        write_copy_text(buffer, memory_id)
+        write_copy_text(buffer, row.user_id)
+        write_copy_text(buffer, row.conversation_id)
+        buffer.write(struct.pack("!iq", 8, created_at // timedelta(microseconds=1)))
+        write_copy_text(buffer, row.content)
+        buffer.write(struct.pack("!i", vector_size))
+        buffer.write(vector_header)
+        buffer.write(vector.tobytes())
+    buffer.write(PGCOPY_TRAILER)
+    return buffer.getvalue()
+
+
+def copy_batch(connection, ids: list[str], rows: list[IngestRow], vectors: np.ndarray):
+    with connection.cursor() as cursor:
+        cursor.copy_expert(COPY_QUERY, io.BytesIO(encode_copy_batch(ids, rows, vectors)))
+    connection.commit()
+
+
+def insert_batch(connection, ids: list[str], rows: list[IngestRow], vectors: np.ndarray):
+    now = datetime.now(timezone.utc)
+    values = [
+        (
+            memory_id, row.user_id, row.conversation_id, row.created_at or now, row.content,
+            "[" + ",".join(map(str, vector.tolist())) + "]",
+        )
+        for memory_id, row, vector in zip(ids, rows, vectors)
+    ]
+    with connection.cursor() as cursor:
+        execute_values(cursor, INSERT_QUERY, values, page_size=len(values))
+    connection.commit()
+
+
+def ingest_rows(
+        rows: Iterable[IngestRow],
+        embedder: Embedder,
+        batch_size: int = INGEST_BATCH_SIZE,
+        method: str = INGEST_METHOD,
+        report: IngestReport | None = None,
+) -> IngestReport:
+    writers = {"copy": copy_batch, "insert": insert_batch}
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    if method not in writers:
+        raise ValueError(f"unknown ingest method: {method}")
+    write_batch = writers[method]
+
+    report = report or IngestReport()
+    started = time.perf_counter()
+    connection = engine.raw_connection()
+    try:
+        for batch in batched(rows, batch_size):
+            ids = [ulid() for _ in batch]
+            write_batch(connection, ids, list(batch), embedder.embed([row.content for row in batch]))
+            invalidate_search_cache()
+
+            report.rows += len(batch)
+            report.batches += 1
+            report.seconds = time.perf_counter() - started
+            logger.info(f"ingested {report.rows} rows ({report.rows_per_second:.1f} rows/s)")
+    finally:
+        connection.close()
+
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def ingest_lines(
+        lines: Iterable[str | bytes],
+        embedder: Embedder | None = None,
+        batch_size: int = INGEST_BATCH_SIZE,
+        method: str = INGEST_METHOD,
+) -> IngestReport:
+    report = IngestReport()
+    # ingested turns are mostly unique, so they would only push useful entries out of the embedding cache
+    embedder = embedder or get_embedder(cached=False)
+    return ingest_rows(read_rows(lines, report), embedder, batch_size, method, report)
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Stream a JSONL file of conversation turns into the history table")
+    parser.add_argument("path", help="JSONL file, or - for stdin")
+    parser.add_argument("--batch-size", type=positive_int, default=INGEST_BATCH_SIZE)
+    parser.add_argument("--method", choices=("copy", "insert"), default=INGEST_METHOD)
+    parser.add_argument("--embedder", choices=("hash", "openai"), default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+
+    embedder = get_embedder(args.embedder, cached=False)
+    try:
+        if args.path == "-":
+            report = ingest_lines(sys.stdin, embedder, args.batch_size, args.method)
+        else:
+            with open(args.path, encoding="utf-8") as file:
+                report = ingest_lines(file, embedder, args.batch_size, args.method)
+    except IngestError as error:
+        print(json.dumps({"error": str(error), **error.report.as_dict()}))
+        sys.exit(1)
+
+    print(json.dumps(report.as_dict()))
+
+
+if __name__ == "__main__":
+    main()
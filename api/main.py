@@ -1,8 +1,29 @@
+import json
 import logging
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime, timezone
+from functools import cache
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, UploadFile
+from pydantic import BaseModel, Field
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
-from api.database import SessionLocal, simples_distance_query
+from api.cache import CACHE_ENABLED, cache_stats, invalidation_listener, search_cache
+from api.database import (
+    HNSW_MAX_EF_SEARCH,
+    VECTOR_DIMENSIONS,
+    AsyncSessionLocal,
+    MemoryFilter,
+    SearchMode,
+    async_engine,
+    async_ensure_schema,
+)
+from api.embeddings import Embedder, get_embedder
+from api.ingest import INGEST_BATCH_SIZE, IngestError, ingest_lines
+from api.metrics import METRICS_ENABLED, observe_stage, recent_explains, registry, request_seconds
+from api.search import NumpyBackend, search_backend
 from api.utils import vector_to_compare
 
 # Configure logging
@@ -11,22 +32,195 @@ logging.basicConfig(
     format="%(asctime)s %(levelname)s %(name)s %(message)s"
 )
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await async_ensure_schema()
+    async with AsyncExitStack() as stack:
+        if isinstance(search_backend, NumpyBackend):
+            await stack.enter_async_context(search_backend.running())
+        if CACHE_ENABLED:
+            await stack.enter_async_context(invalidation_listener())
+        yield
+    await async_engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+if METRICS_ENABLED:
+    @app.middleware("http")
+    async def observe_requests(request: Request, call_next):
+        started = time.perf_counter()
+        response = await call_next(request)
+        route = request.scope.get("route")
+        request_seconds.observe(
+            time.perf_counter() - started,
+            route.path if route else "unmatched", request.method, str(response.status_code),
+        )
+        return response
+
+BATCH_MAX_QUERIES = 256
+
+
+class BatchQuery(BaseModel):
+    vector: list[float] = Field(min_length=VECTOR_DIMENSIONS, max_length=VECTOR_DIMENSIONS)
+    limit: int = Field(100, ge=1)
+    max_distance: float = 30.0
+
+
+def make_filter(
+        user_id: str | None,
+        conversation_id: str | None,
+        since: datetime | None,
+        until: datetime | None,
+        last_turns: int | None,
+) -> MemoryFilter | None:
+    # naive timestamps are taken as UTC, the same as ingested created_at values
+    since, until = (value.replace(tzinfo=timezone.utc) if value and not value.tzinfo else value for value in (since, until))
+    filters = MemoryFilter(user_id, conversation_id, since, until, last_turns)
+    return None if filters.is_empty() else filters
+
+
+def memory_filter(
+        user_id: str | None = None,
+        conversation_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        last_turns: int | None = Query(None, ge=0),
+) -> MemoryFilter | None:
+    return make_filter(user_id, conversation_id, since, until, last_turns)
+
+
+class BatchSearchRequest(BaseModel):
+    queries: list[BatchQuery] = Field(min_length=1, max_length=BATCH_MAX_QUERIES)
+    mode: SearchMode | None = None
+    ef_search: int | None = Field(None, ge=1, le=HNSW_MAX_EF_SEARCH)
+    oversampling: float | None = Field(None, ge=1, allow_inf_nan=False)
+    user_id: str | None = None
+    conversation_id: str | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+    last_turns: int | None = Field(None, ge=0)
+    recency_weight: float | None = Field(None, ge=0)
+    recency_half_life: float | None = Field(None, gt=0)
+
+    def filters(self) -> MemoryFilter | None:
+        return make_filter(self.user_id, self.conversation_id, self.since, self.until, self.last_turns)
+
+
+@cache
+def query_embedder() -> Embedder:
+    return get_embedder()
+
+
+async def query_vector(query: str | None = None) -> list[float]:
+    # free text goes through the cached embedder, without it the fixed sample vector is searched
+    if query is None:
+        return vector_to_compare
+    vectors = await run_in_threadpool(query_embedder().embed, [query])
+    return vectors[0].tolist()
+
+
+def serialize_hit(memory_id: str, content: str, distance: float) -> dict:
+    return {"memory": {"id": memory_id, "content": content }, "proximity": (1 - distance) * 100}
+
+
+def serialize_hits(items) -> list[dict]:
+    return [serialize_hit(*item) for item in items]
 
 
 @app.get("/")
-def entrypoint():
-    with SessionLocal() as session:
-        return {"message": "DB Connected", "connection": str(session.connection().engine.url.render_as_string(hide_password=True))}
+async def entrypoint():
+    async with AsyncSessionLocal() as session:
+        connection = await session.connection()
+        return {"message": "DB Connected", "connection": str(connection.engine.url.render_as_string(hide_password=True))}
 
 
 @app.get("/test-distance")
-def test_distance():
-    with SessionLocal() as session:
-        result = []
+async def test_distance(
+        limit: int = Query(100, ge=1),
+        max_distance: float = 30.0,
+        mode: SearchMode | None = None,
+        ef_search: int | None = Query(None, ge=1, le=HNSW_MAX_EF_SEARCH),
+        oversampling: float | None = Query(None, ge=1, allow_inf_nan=False),
+        filters: MemoryFilter | None = Depends(memory_filter),
+        recency_weight: float | None = Query(None, ge=0),
+        recency_half_life: float | None = Query(None, gt=0),
+        vector: list[float] = Depends(query_vector),
+):
+    options = {
+        "mode": mode, "ef_search": ef_search, "oversampling": oversampling,
+        "filters": filters, "recency_weight": recency_weight, "recency_half_life": recency_half_life,
+    }
+    cache_key = search_cache.key(vector, limit, max_distance, backend=search_backend.name, **options)
+    items = search_cache.get(cache_key) if CACHE_ENABLED else None
 
-        for memory, distance in simples_distance_query(
-                session, vector_to_compare
+    if items is None:
+        items = await search_backend.search(vector, limit, max_distance, **options)
+        if CACHE_ENABLED:
+            search_cache.set(cache_key, items)
+
+    with observe_stage("serialize"):
+        return {"items": serialize_hits(items)}
+
+
+@app.get("/test-distance/stream")
+async def test_distance_stream(
+        limit: int = Query(100, ge=1),
+        max_distance: float = 30.0,
+        mode: SearchMode | None = None,
+        ef_search: int | None = Query(None, ge=1, le=HNSW_MAX_EF_SEARCH),
+        oversampling: float | None = Query(None, ge=1, allow_inf_nan=False),
+        filters: MemoryFilter | None = Depends(memory_filter),
+        recency_weight: float | None = Query(None, ge=0),
+        recency_half_life: float | None = Query(None, gt=0),
+        vector: list[float] = Depends(query_vector),
+):
+    async def lines():
+        async for hit in search_backend.stream(
+                vector, limit, max_distance, mode=mode, ef_search=ef_search, oversampling=oversampling,
+                filters=filters, recency_weight=recency_weight, recency_half_life=recency_half_life,
         ):
-            result.append({"memory": {"id": memory.id, "content": memory.content }, "proximity": (1 - distance) * 100})
-        return {"items": result}
+            yield json.dumps(serialize_hit(*hit)) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.post("/search/batch")
+async def search_batch(request: BatchSearchRequest):
+    groups = await search_backend.search_batch(
+        [query.vector for query in request.queries],
+        [query.limit for query in request.queries],
+        [query.max_distance for query in request.queries],
+        mode=request.mode, ef_search=request.ef_search, oversampling=request.oversampling,
+        filters=request.filters(), recency_weight=request.recency_weight, recency_half_life=request.recency_half_life,
+    )
+    with observe_stage("serialize"):
+        return {"results": [{"items": serialize_hits(items)} for items in groups]}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/metrics/explain")
+async def explain_captures():
+    return {"items": list(recent_explains)}
+
+
+@app.get("/cache/stats")
+async def get_cache_stats():
+    return cache_stats()
+
+
+@app.post("/memories/ingest")
+async def ingest_memories(file: UploadFile, batch_size: int = Query(INGEST_BATCH_SIZE, ge=1)):
+    # the upload is spooled to disk and read line by line, so memory stays bounded by batch_size
+    try:
+        report = await run_in_threadpool(ingest_lines, file.file, batch_size=batch_size)
+    except IngestError as error:
+        # earlier batches are committed, so tell the caller how far the file got
+        raise HTTPException(400, {"error": str(error), **error.report.as_dict()}) from error
+    return report.as_dict()
@@ -0,0 +1,183 @@
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging import getLogger
+from typing import Callable, Iterable
+
+from api.utils import env_bool
+
+logger = getLogger(__name__)
+
+
+METRICS_ENABLED = env_bool("METRICS_ENABLED", True)
+# 0 turns EXPLAIN capture off; otherwise queries slower than this are sampled at EXPLAIN_SAMPLE_RATE
+EXPLAIN_SLOW_MS = float(os.getenv("EXPLAIN_SLOW_MS", "0"))
+EXPLAIN_SAMPLE_RATE = float(os.getenv("EXPLAIN_SAMPLE_RATE", "0.1"))
+EXPLAIN_KEEP = int(os.getenv("EXPLAIN_KEEP", "20"))
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ROW_BUCKETS = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+def format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, *label_values: str):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        for label_values, value in sorted(self._values.items()):
+            yield f"{self.name}{format_labels(self.labels, label_values)} {value}"
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, buckets: tuple[float, ...], labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        self.labels = labels
+        # per label set: [count per bucket..., +Inf count, sum]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str):
+        with self._lock:
+            series = self._values.get(label_values)
+            if series is None:
+                series = self._values[label_values] = [0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+            series[-2] += 1
+            series[-1] += value
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        for label_values, series in sorted(self._values.items()):
+            for bound, count in zip(self.buckets + ("+Inf",), series):
+                labels = format_labels(self.labels, label_values, f'le="{bound}"')
+                yield f"{self.name}_bucket{labels} {count}"
+            yield f"{self.name}_count{format_labels(self.labels, label_values)} {series[-2]}"
+            yield f"{self.name}_sum{format_labels(self.labels, label_values)} {series[-1]}"
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: list[Counter | Histogram] = []
+        self.collectors: list[Callable[[], Iterable[str]]] = []
+
+    def counter(self, name: str, help: str, labels: tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, help, labels)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help: str, buckets: tuple[float, ...], labels: tuple[str, ...] = ()) -> Histogram:
+        metric = Histogram(name, help, buckets, labels)
+        self.metrics.append(metric)
+        return metric
+
+    def collector(self, collect: Callable[[], Iterable[str]]):
+        self.collectors.append(collect)
+        return collect
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        for collect in self.collectors:
+            lines.extend(collect())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+request_seconds = registry.histogram(
+    "http_request_duration_seconds", "Time spent handling requests", LATENCY_BUCKETS, ("route", "method", "status")
+)
+stage_seconds = registry.histogram(
+    "search_stage_duration_seconds", "Time spent in each stage of a search", LATENCY_BUCKETS, ("stage",)
+)
+rows_returned = registry.histogram("search_rows_returned", "Rows returned per search", ROW_BUCKETS)
+rows_scanned = registry.histogram("search_rows_scanned", "Rows scanned per search, from sampled EXPLAIN plans", ROW_BUCKETS)
+explain_captures = registry.counter("search_explain_captures_total", "EXPLAIN (ANALYZE, BUFFERS) plans captured")
+
+recent_explains: deque[dict] = deque(maxlen=EXPLAIN_KEEP)
+
+
+@contextmanager
+def observe_stage(stage: str):
+    if not METRICS_ENABLED:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stage_seconds.observe(time.perf_counter() - started, stage)
+
+
+def observe_seconds(stage: str, seconds: float):
+    if METRICS_ENABLED:
+        stage_seconds.observe(seconds, stage)
+
+
+def observe_rows(count: int):
+    if METRICS_ENABLED:
+        rows_returned.observe(count)
+
+
+def should_explain(seconds: float) -> bool:
+    return EXPLAIN_SLOW_MS > 0 and seconds * 1000 >= EXPLAIN_SLOW_MS and random.random() < EXPLAIN_SAMPLE_RATE
+
+
+def explain_sql(statement, dialect) -> str:
+    # literal binds make the statement self-contained, which is fine for the rare sampled capture
+    compiled = statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    return f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {compiled}"
+
+
+def scanned_rows(node: dict) -> int:
+    rows = 0
+    if "Scan" in node.get("Node Type", ""):
+        rows += int(node.get("Actual Rows", 0) * node.get("Actual Loops", 1))
+    for child in node.get("Plans", []):
+        rows += scanned_rows(child)
+    return rows
+
+
+def record_explain(plan, seconds: float):
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    scanned = scanned_rows(plan[0]["Plan"])
+    rows_scanned.observe(scanned)
+    explain_captures.inc()
+    recent_explains.append({
+        "captured_at": datetime.now(timezone.utc).isoformat(),
+        "duration_ms": seconds * 1000,
+        "rows_scanned": scanned,
+        "plan": plan,
+    })
+    logger.warning(f"slow search query took {seconds * 1000:.1f}ms and scanned {scanned} rows")
@@ -0,0 +1,432 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager, suppress
+from logging import getLogger
+from typing import AsyncIterator, NamedTuple, Protocol
+
+import numpy as np
+from sqlalchemy import select
+
+from api.cache import invalidate_search_cache
+from api.database import (
+    AsyncSessionLocal,
+    DEFAULT_USER_ID,
+    Memory,
+    MemoryFilter,
+    RECENCY_HALF_LIFE_SECONDS,
+    VECTOR_DIMENSIONS,
+    async_batch_distance_query,
+    async_simples_distance_query,
+    async_stream_distance_query,
+)
+from api.metrics import observe_rows, observe_stage
+
+logger = getLogger(__name__)
+
+# "pgvector" runs every search in postgres, "numpy" keeps a copy of history in memory
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "pgvector")
+NUMPY_DTYPE = os.getenv("NUMPY_DTYPE", "float32")
+# every process maps its own file, NUMPY_MMAP_PATH suffixed with the pid, since each one rebuilds and grows it
+NUMPY_MMAP_PATH = os.getenv("NUMPY_MMAP_PATH") or None
+NUMPY_REFRESH_SECONDS = float(os.getenv("NUMPY_REFRESH_SECONDS", "5"))
+NUMPY_REFRESH_BATCH = int(os.getenv("NUMPY_REFRESH_BATCH", "1000"))
+NUMPY_REFRESH_WINDOW_SECONDS = float(os.getenv("NUMPY_REFRESH_WINDOW_SECONDS", "300"))
+# 0 turns the periodic full rebuild off
+NUMPY_RECONCILE_SECONDS = float(os.getenv("NUMPY_RECONCILE_SECONDS", "900"))
+
+# float16 rows are upcast in chunks of this many rows, there is no float16 BLAS to hand them to
+FLOAT16_CHUNK_ROWS = 16384
+
+CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+HISTORY_COLUMNS = (Memory.id, Memory.content, Memory.vector, Memory.user_id, Memory.conversation_id, Memory.created_at)
+
+
+class SearchHit(NamedTuple):
+    id: str
+    content: str
+    distance: float
+
+
+class SearchBackend(Protocol):
+    name: str
+
+    async def search(self, query_vector: list[float], limit: int = 100, max_distance: float = 30.0, **options) -> list[SearchHit]: ...
+
+    async def search_batch(self, query_vectors: list[list[float]], limits: list[int], max_distances: list[float], **options) -> list[list[SearchHit]]: ...
+
+    def stream(self, query_vector: list[float], limit: int = 100, max_distance: float = 30.0, **options) -> AsyncIterator[SearchHit]: ...
+
+
+class PgVectorBackend:
+    name = "pgvector"
+
+    async def search(self, query_vector: list[float], limit: int = 100, max_distance: float = 30.0, **options) -> list[SearchHit]:
+        async with AsyncSessionLocal() as session:
+            result = await async_simples_distance_query(session, query_vector, limit, max_distance, **options)
+            with observe_stage("hydrate"):
+                hits = [SearchHit(*row) for row in result]
+        observe_rows(len(hits))
+        return hits
+
+    async def search_batch(self, query_vectors: list[list[float]], limits: list[int], max_distances: list[float], **options) -> list[list[SearchHit]]:
+        async with AsyncSessionLocal() as session:
+            groups = await async_batch_distance_query(session, query_vectors, limits, max_distances, **options)
+        hits = [[SearchHit(*row) for row in rows] for rows in groups]
+        for rows in hits:
+            observe_rows(len(rows))
+        return hits
+
+    async def stream(self, query_vector: list[float], limit: int = 100, max_distance: float = 30.0, **options) -> AsyncIterator[SearchHit]:
+        async with AsyncSessionLocal() as session:
+            async for row in async_stream_distance_query(session, query_vector, limit, max_distance, **options):
+                yield SearchHit(*row)
+
+
+def ulid_floor(timestamp: float) -> str:
+    # the smallest ULID minted at this unix time: 48 bits of milliseconds in base32, then zero randomness
+    milliseconds = max(int(timestamp * 1000), 0)
+    chars = []
+    for _ in range(10):
+        chars.append(CROCKFORD_ALPHABET[milliseconds & 31])
+        milliseconds >>= 5
+    return "".join(reversed(chars)) + "0" * 16
+
+
+class NumpyStore:
+    def __init__(self, dtype: np.dtype, mmap_path: str | None, dimensions: int, initial_capacity: int = 1024):
+        self.dtype = dtype
+        self.mmap_path = mmap_path
+        self.dimensions = dimensions
+
+        self.size = 0
+        self.ids: list[str] = []
+        self.contents: list[str] = []
+        self.positions: dict[str, int] = {}
+        self._matrix = self._allocate(initial_capacity, mode="w+")
+        self._zero = np.zeros(initial_capacity, dtype=bool)
+        # filter columns, kept as arrays so a filter is one vectorised comparison per search
+        self._user_ids = np.empty(initial_capacity, dtype=object)
+        self._conversation_ids = np.empty(initial_capacity, dtype=object)
+        self._created_at = np.zeros(initial_capacity, dtype=np.float64)
+
+    def _allocate(self, capacity: int, mode: str = "r+") -> np.ndarray:
+        if self.mmap_path is None:
+            return np.empty((capacity, self.dimensions), dtype=self.dtype)
+
+        if mode == "r+":
+            with open(self.mmap_path, "r+b") as file:
+                file.truncate(capacity * self.dimensions * self.dtype.itemsize)
+        return np.memmap(self.mmap_path, dtype=self.dtype, mode=mode, shape=(capacity, self.dimensions))
+
+    def _grow(self, needed: int):
+        capacity = max(needed, 2 * len(self._matrix))
+
+        if self.mmap_path is None:
+            matrix = self._allocate(capacity)
+            matrix[:self.size] = self._matrix[:self.size]
+        else:
+            # growing the file keeps the rows already written, only the mapping has to be redone
+            self._matrix.flush()
+            matrix = self._allocate(capacity)
+
+        zero = np.zeros(capacity, dtype=bool)
+        zero[:self.size] = self._zero[:self.size]
+        self._matrix, self._zero = matrix, zero
+
+        for name in ("_user_ids", "_conversation_ids", "_created_at"):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype) if column.dtype != object else np.empty(capacity, dtype=object)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+
+    def add(
+            self,
+            ids: list[str],
+            contents: list[str],
+            vectors: np.ndarray,
+            user_ids: list[str] | None = None,
+            conversation_ids: list[str | None] | None = None,
+            created_at: list[float] | None = None,
+    ):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.size + len(ids) > len(self._matrix):
+            self._grow(self.size + len(ids))
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        end = self.size + len(ids)
+        self._matrix[self.size:end] = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+        # pgvector returns NaN for the cosine distance of a zero vector, which never passes max_distance
+        self._zero[self.size:end] = norms[:, 0] == 0
+        self._user_ids[self.size:end] = user_ids if user_ids is not None else DEFAULT_USER_ID
+        self._conversation_ids[self.size:end] = conversation_ids if conversation_ids is not None else None
+        self._created_at[self.size:end] = created_at if created_at is not None else time.time()
+
+        self.ids.extend(ids)
+        self.contents.extend(contents)
+        self.positions.update(zip(ids, range(self.size, end)))
+        # searches on another thread read size first, so it only moves once the rows are in place
+        self.size = end
+
+    def add_rows(self, rows):
+        self.add(
+            [row.id for row in rows],
+            [row.content for row in rows],
+            np.stack([np.asarray(row.vector, dtype=np.float32) for row in rows]),
+            [row.user_id for row in rows],
+            [row.conversation_id for row in rows],
+            [row.created_at.timestamp() for row in rows],
+        )
+
+    def flush(self):
+        if self.mmap_path is not None:
+            self._matrix.flush()
+
+    def mask(self, size: int, filters: MemoryFilter | None) -> np.ndarray | None:
+        if filters is None or filters.is_empty():
+            return None
+
+        created_at = self._created_at[:size]
+        mask = np.ones(size, dtype=bool)
+        if filters.user_id is not None:
+            mask &= self._user_ids[:size] == filters.user_id
+        if filters.conversation_id is not None:
+            mask &= self._conversation_ids[:size] == filters.conversation_id
+        if filters.since is not None:
+            mask &= created_at >= filters.since.timestamp()
+        if filters.until is not None:
+            mask &= created_at < filters.until.timestamp()
+        if filters.last_turns is not None:
+            matching = np.flatnonzero(mask)
+            newest = matching[np.argsort(created_at[matching], kind="stable")][max(len(matching) - filters.last_turns, 0):]
+            mask = np.zeros(size, dtype=bool)
+            mask[newest] = True
+        return mask
+
+    def recency_penalty(self, size: int, recency_weight: float, recency_half_life: float) -> np.ndarray | None:
+        if not recency_weight:
+            return None
+        # same curve as the SQL ranking: 0 for a memory written now, approaching recency_weight with age
+        age = time.time() - self._created_at[:size]
+        return recency_weight * (1 - np.power(0.5, age / recency_half_life))
+
+    def distances(self, size: int, queries: np.ndarray, mask: np.ndarray | None = None) -> np.ndarray:
+        matrix = self._matrix[:size]
+
+        if self.dtype == np.float32:
+            similarities = queries @ matrix.T
+        else:
+            similarities = np.empty((len(queries), size), dtype=np.float32)
+            for start in range(0, size, FLOAT16_CHUNK_ROWS):
+                chunk = matrix[start:start + FLOAT16_CHUNK_ROWS].astype(np.float32)
+                similarities[:, start:start + len(chunk)] = queries @ chunk.T
+
+        distances = 1 - similarities
+        distances[:, self._zero[:size]] = np.nan
+        if mask is not None:
+            distances[:, ~mask] = np.nan
+        return distances
+
+    def top_k(self, distances: np.ndarray, limit: int, max_distance: float, penalty: np.ndarray | None = None) -> list[SearchHit]:
+        candidates = np.flatnonzero(distances < max_distance)
+        ranking = distances if penalty is None else distances + penalty
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(ranking[candidates], limit - 1)[:limit]]
+        candidates = candidates[np.argsort(ranking[candidates], kind="stable")]
+        return [SearchHit(self.ids[index], self.contents[index], float(distances[index])) for index in candidates]
+
+    def search(
+            self,
+            queries: np.ndarray,
+            limits: list[int],
+            max_distances: list[float],
+            filters: MemoryFilter | None = None,
+            recency_weight: float = 0.0,
+            recency_half_life: float = RECENCY_HALF_LIFE_SECONDS,
+    ) -> list[list[SearchHit]]:
+        # one size for the whole search, rows appended meanwhile are simply not seen yet
+        size = self.size
+        if size == 0:
+            return [[] for _ in limits]
+
+        # one matmul for the whole batch, then a cheap argpartition per query row
+        distances = self.distances(size, queries, self.mask(size, filters))
+        penalty = self.recency_penalty(size, recency_weight, recency_half_life)
+        return [
+            self.top_k(row, limit, max_distance, penalty) if limit > 0 else []
+            for row, limit, max_distance in zip(distances, limits, max_distances, strict=True)
+        ]
+
+
+class NumpyBackend:
+    name = "numpy"
+
+    def __init__(
+            self,
+            dtype: str = NUMPY_DTYPE,
+            mmap_path: str | None = NUMPY_MMAP_PATH,
+            refresh_seconds: float = NUMPY_REFRESH_SECONDS,
+            refresh_batch: int = NUMPY_REFRESH_BATCH,
+            refresh_window_seconds: float = NUMPY_REFRESH_WINDOW_SECONDS,
+            reconcile_seconds: float = NUMPY_RECONCILE_SECONDS,
+            dimensions: int = VECTOR_DIMENSIONS,
+            initial_capacity: int = 1024,
+    ):
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"unsupported numpy dtype: {dtype}")
+
+        self.dtype = np.dtype(dtype)
+        # a path shared by several workers would have each one truncate and replace the file under the others
+        self.mmap_path = None if mmap_path is None else f"{mmap_path}.{os.getpid()}"
+        self.refresh_seconds = refresh_seconds
+        self.refresh_batch = refresh_batch
+        self.refresh_window_seconds = refresh_window_seconds
+        self.reconcile_seconds = reconcile_seconds
+        self.dimensions = dimensions
+
+        self.store = NumpyStore(self.dtype, self.mmap_path, dimensions, initial_capacity)
+        self.refreshed_at: float | None = None
+        self.reconciled_at: float | None = None
+        # wall clock start of the last refresh, the trailing window is measured back from it
+        self._refresh_started: float | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def size(self) -> int:
+        return self.store.size
+
+    async def load_rows(self, session, store: NumpyStore, ids: list[str]):
+        for start in range(0, len(ids), self.refresh_batch):
+            rows = (await session.execute(
+                select(*HISTORY_COLUMNS).where(Memory.id.in_(ids[start:start + self.refresh_batch])).order_by(Memory.id)
+            )).all()
+            if rows:
+                store.add_rows(rows)
+
+    async def refresh(self):
+        async with self._lock:
+            started = time.time()
+            # ids are minted before a batch is embedded and committed after, so a row can become visible well after
+            # larger ids did; re-reading the ids of the trailing window catches those late commits
+            since = "" if self._refresh_started is None else ulid_floor(self._refresh_started - self.refresh_window_seconds)
+            async with AsyncSessionLocal() as session:
+                ids = (await session.execute(select(Memory.id).where(Memory.id > since).order_by(Memory.id))).scalars().all()
+                missing = [memory_id for memory_id in ids if memory_id not in self.store.positions]
+                await self.load_rows(session, self.store, missing)
+            self._refresh_started = started
+            self.refreshed_at = time.monotonic()
+
+        if missing:
+            # the write already invalidated the cache on commit, but a search in between cached hits from before
+            # these rows were loaded; bumping again once they are searchable drops those
+            invalidate_search_cache()
+
+    async def reconcile(self):
+        # updates, deletes and rows committed later than the trailing window are only seen by a full rebuild,
+        # which is loaded into a new store and swapped in so searches keep using the old one meanwhile
+        async with self._lock:
+            started = time.time()
+            next_path = None if self.mmap_path is None else self.mmap_path + ".next"
+            store = NumpyStore(self.dtype, next_path, self.dimensions, max(len(self.store.ids), 1024))
+
+            async with AsyncSessionLocal() as session:
+                # one snapshot for every page, so the rebuild never sees a write half way through
+                await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+                last_id = ""
+                while True:
+                    rows = (await session.execute(
+                        select(*HISTORY_COLUMNS).where(Memory.id > last_id).order_by(Memory.id).limit(self.refresh_batch)
+                    )).all()
+                    if rows:
+                        store.add_rows(rows)
+                        last_id = rows[-1].id
+                    if len(rows) < self.refresh_batch:
+                        break
+
+            if next_path is not None:
+                store.flush()
+                os.replace(next_path, self.mmap_path)
+                store.mmap_path = self.mmap_path
+            self.store = store
+            self._refresh_started = started
+            self.refreshed_at = self.reconciled_at = time.monotonic()
+
+        # the rebuild can drop deleted rows and pick up updated ones, anything cached before the swap may be stale
+        invalidate_search_cache()
+
+    async def run(self):
+        # keeps the matrix fresh in the background, so no request waits on a refresh
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                if self.reconcile_seconds and time.monotonic() - (self.reconciled_at or 0) >= self.reconcile_seconds:
+                    await self.reconcile()
+                else:
+                    await self.refresh()
+            except Exception:
+                logger.exception("numpy backend refresh failed, serving the rows already loaded")
+
+    @asynccontextmanager
+    async def running(self) -> AsyncIterator[None]:
+        await self.reconcile()
+        task = asyncio.create_task(self.run())
+        try:
+            yield
+        finally:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+            if self.mmap_path is not None:
+                # the file is only ever read by this process, nothing needs it once the app stops
+                with suppress(FileNotFoundError):
+                    os.remove(self.mmap_path)
+
+    def normalize_queries(self, query_vectors) -> np.ndarray:
+        queries = np.atleast_2d(np.asarray(query_vectors, dtype=np.float32))
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return queries / norms
+
+    async def search_many(self, query_vectors, limits: list[int], max_distances: list[float], options: dict) -> list[list[SearchHit]]:
+        # only the first search outside of running() pays for a load on the request path
+        if self.refreshed_at is None:
+            await self.refresh()
+
+        # the matmul and argpartition cost milliseconds of CPU, a worker thread keeps the event loop serving
+        with observe_stage("execute"):
+            hits = await asyncio.to_thread(
+                self.store.search,
+                self.normalize_queries(query_vectors), limits, max_distances,
+                options.get("filters"),
+                options.get("recency_weight") or 0.0,
+                options.get("recency_half_life") or RECENCY_HALF_LIFE_SECONDS,
+            )
+        for rows in hits:
+            observe_rows(len(rows))
+        return hits
+
+    async def search(self, query_vector: list[float], limit: int = 100, max_distance: float = 30.0, **options) -> list[SearchHit]:
+        # options such as mode/ef_search only apply to pgvector, this engine is always exact
+        return (await self.search_many([query_vector], [limit], [max_distance], options))[0]
+
+    async def stream(self, query_vector: list[float], limit: int = 100, max_distance: float = 30.0, **options) -> AsyncIterator[SearchHit]:
+        # the hits are already in memory, streaming only saves building the response in one piece
+        for hit in await self.search(query_vector, limit, max_distance, **options):
+            yield hit
+
+    async def search_batch(self, query_vectors: list[list[float]], limits: list[int], max_distances: list[float], **options) -> list[list[SearchHit]]:
+        if not query_vectors:
+            return []
+        return await self.search_many(query_vectors, limits, max_distances, options)
+
+
+def make_search_backend(name: str | None = None) -> SearchBackend:
+    name = name or SEARCH_BACKEND
+    if name == "pgvector":
+        return PgVectorBackend()
+    if name == "numpy":
+        return NumpyBackend()
+    raise ValueError(f"unknown search backend: {name}")
+
+
+search_backend = make_search_backend()
@@ -1,3 +1,8 @@
+import os
+
+
+def env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).lower() in ("1", "true", "yes", "on")
 
 
 vector_to_compare = [0.045099378,0.0054511423,-0.0034641551,-0.010895749,0.0143664405,-0.025190292,-0.015961258,-0.014667102,0.033046734,0.02883746,-0.022824207,0.042720225,-0.05317805,-0.029334204,0.037282154,0.018510355,0.00012398245,0.036184084,-0.004467453,-0.0077584004,0.0006491206,0.0025490953,0.0013137645,0.011693158,0.0020082297,0.0010204552,-0.012274874,-0.0015343593,-0.0023546452,0.02380463,-0.0036275587,0.03244541,0.0375436,0.0066015036,-0.048550464,-0.0049380553,0.00469295,0.0214124,-0.0025654358,-0.015948186,0.002712499,-0.036314804,-0.026288362,-0.0031389822,0.0209418,0.06844648,0.010647375,0.017556077,-0.043295406,0.019699931,-0.0021994119,0.0001819907,-0.015752101,-0.009398972,-0.019333908,-0.013189934,-0.024785051,-0.044733357,0.00044078106,-0.036105648,-0.030536855,0.011281381,-0.010856532,0.012529784,-0.020039812,-0.04807986,-0.010144092,-0.04402745,0.03147806,-0.0022484327,-0.020654209,-0.010529725,-0.016693307,-0.023830773,-0.0057289284,-0.011425176,-0.0029298256,-0.014889332,-0.024968062,0.054066967,0.0024134705,0.004970736,0.018693365,-0.020928727,0.025373302,-0.028915891,-0.01316379,-0.028471434,-0.002627529,0.02237975,0.012667043,0.0056047416,-0.012921953,-0.023216376,0.045491546,-0.028915891,-0.047373958,-0.011948068,-0.020758787,0.0024706617,-0.050459016,-0.004555691,-0.001933064,-0.0029085833,-0.003957634,0.012425206,-0.05241986,0.01790903,-0.0066211117,0.03239312,0.03147806,-0.009810749,0.017843667,-0.00821593,-0.054746725,-0.03503372,-0.044498056,-0.042877093,-0.038667817,0.028732881,-0.011778127,-0.031844083,-0.00432039,-0.012385989,0.007333551,0.018222764,0.015725957,0.025700111,-0.04465492,0.01819662,-0.054171544,-0.0045360825,0.005356368,0.0062224073,0.033517335,-0.0064250277,-0.048106004,0.00026246696,0.014562524,0.0052583264,-0.009497014,0.0123271635,-0.0047583114,-0.027634809,-0.0471648,0.017163908,0.028419144,0.011327134,-0.0019101875,-0.020275112,-0.019163968,-0.01585668,-0.017477643,0.050354436,-0.020614991,0.033778783,-0.004572031,0.0055034314,-0.0012598414,0.036811553,-0.044315044,0.008967587,-0.0001448164,-0.011523218,0.0012696455,-0.011255236,0.03085059,-0.027216496,-0.0064315638,0.019268546,0.008026382,-0.0054086572,-0.0017157373,0.011993821,0.031085892,0.06368817,0.0021569268,-0.01373897,-0.02277192,0.024249086,0.03171336,0.023778485,0.010876141,0.02312487,0.0093270745,-0.0060491995,0.005562257,0.03435396,-0.030955167,-0.07665587,-0.00858849,-0.024131436,0.016444933,-0.041569863,0.0009354853,0.0118565615,-0.03341276,0.0222621,0.0005163552,0.0077518644,0.04881191,-0.016889391,0.014471019,-0.024419026,0.018614933,-0.045569982,0.019046318,-0.017752161,0.016536439,-0.0031716628,0.07079949,-0.054799013,0.010529725,0.0013088625,-0.00035254317,0.01441873,0.004042604,0.015660597,-0.011934996,0.021268606,-0.0037157966,-0.03388336,-0.01711162,-0.028000832,-0.04951781,0.0020801271,0.018954812,-0.009497014,0.001475534,0.02907276,-0.01785674,0.0153599335,0.008706141,0.012765085,-0.008653852,0.012392526,-0.0024935382,0.014065778,0.008183249,0.019399269,-0.033177458,0.043661427,-0.025111858,-0.001659363,0.033386614,0.017490717,-0.02868059,-0.04687721,0.0053171515,-0.03336047,0.010379394,0.002021302,0.017203126,0.017412283,0.0007733073,-0.012699724,0.042484924,-0.009784604,-0.008830328,0.018222764,0.0024494191,-0.04596215,-0.013595175,0.033229746,0.008804183,0.018405776,-0.004513206,-0.057047445,0.0222621,-0.054171544,-0.002485368,-0.0054478743,0.011137586,0.015203066,0.02456282,-0.0030082592,-0.035530467,0.029491073,0.03932143,0.0030752548,-0.025464809,-0.008595027,-0.05024986,-0.05689058,0.0141965,0.047896847,0.0073596956,0.023281738,0.009980689,0.0055099675,0.010052586,-0.02071957,-0.031399626,0.0067322263,-0.014667102,-0.047190946,0.023216376,-0.005343296,-0.032210108,-0.0021536588,0.009163671,-1.61361e-05,0.008019846,0.00202457,0.06625033,-0.031791795,-0.007144003,-0.009431653,0.008261683,0.0029576041,-0.051400222,0.022706557,-0.010320568,-0.034589265,-0.022549689,-0.033465046,-0.025765471,-0.04489022,0.056733713,0.0133468015,-0.05568793,0.011954604,-0.0399489,-0.015660597,-0.018745655,-0.0040164595,-0.016000476,-0.010693128,0.016222704,0.02134704,0.024732761,-0.02907276,0.042171188,0.019163968,-0.022641195,-0.023595473,-0.025883121,0.032131676,0.023948424,-0.017843667,-0.025255652,0.009902255,0.06577973,0.047818415,0.013274904,0.02288957,0.012647435,0.015673669,0.011183339,0.040890105,0.0006768992,-0.03892926,0.019268546,0.026824327,0.048628896,-0.008405479,-0.028523723,-0.011915387,-0.029386494,-0.0033350664,-0.015608307,-0.02300722,0.0064642443,0.018876377,-0.0016430226,-0.027687097,-0.008706141,0.011908851,-0.00838587,0.054746725,0.0077584004,0.013582103,0.012941561,-0.032131676,0.012255266,-0.015085416,0.04928251,0.03215782,0.0056080096,-0.017386138,0.017020114,-0.059661902,0.007588461,-0.0031095694,-0.029830951,0.0118434895,0.02656288,0.020614991,-0.009287857,0.0214124,0.022301316,-0.031608783,-0.0020180338,0.014980838,0.006954455,-0.0073466236,-0.012817374,0.030040108,0.022562763,-0.036550105,-0.02329481,-0.007215901,-0.0050524375,0.031059746,0.033438902,0.022850351,0.031164324,-0.00010105488,0.020366618,-0.022105232,-0.02810541,-0.017686801,-0.017359992,-0.01590897,-0.035635047,-0.037569743,0.019203184,-0.026667459,-0.028994326,-0.00552304,0.004173327,0.030013964,0.006447904,0.036419384,-0.012980778,0.013804331,-0.027007338,-0.006712618,-0.022981076,-0.023386316,-0.038667817,0.004826941,0.023399388,-0.0012876199,-0.012915417,-0.034955285,-0.0069021657,-0.030118542,0.050851185,-0.040210344,0.005585133,-0.0013015092,-0.012647435,-0.029281916,-0.0060524675,0.013712826,-0.040341068,-0.014209572,0.0062256753,-0.011464393,0.014000416,-0.00174515,-0.003317092,-0.017242342,-0.029046616,-0.0028644642,0.014575597,0.0026487715,-0.0066734008,0.0005159467,0.028576013,0.0031961733,-0.004892302,-0.03508601,-0.01373897,-0.027007338,-0.020131318,0.031504203,-0.029098904,0.0143533675,-0.025059568,0.01826198,-0.044367332,0.015699813,0.0051308717,-0.013477525,-0.0005183978,0.014104994,0.054746725,0.014980838,-0.0286283,0.003686384,-0.0067779794,0.0063335216,-0.0017190053,-0.028497579,0.018444993,-0.034719985,-0.054014675,0.0030654506,0.01499391,-0.00801331,0.008150569,0.011895779,-0.0077453284,-0.0038105708,0.029281916,0.0012116373,-0.0051668203,0.026981194,0.03485071,-0.022588907,-0.009536231,0.0421189,0.018131258,0.0011086931,0.025556315,0.04345227,0.019085534,-0.017124692,0.00024551383,-0.020850293,-0.043373838,-0.0015972697,0.012954634,-0.004735435,0.0019265278,0.0034837637,0.0093270745,0.0073008705,-0.002766422,0.012549393,0.0047125584,-0.00210954,-0.011523218,0.046563476,0.0068498766,-0.0049184468,0.024602039,0.012444815,0.030798301,0.003321994,-0.015817463,0.0012720966,-0.03662854,-0.027138062,0.025255652,0.0040360675,-0.0034706914,-0.0011454589,0.018052824,0.010255206,0.030824445,-0.002444517,0.030327698,0.031059746,-0.009281321,-0.02483734,-0.032837577,-0.022418967,0.04206661,-0.0050949226,0.008993731,0.0074250572,-0.0038955405,0.029098904,-0.010876141,0.020484269,-0.027739387,0.024053002,0.00930093,-0.014288006,0.018105114,0.0030262338,-0.00058294216,0.014248789,0.011510146,-0.02002674,0.007947949,-0.018915595,0.0030131615,0.021386256,0.009719243,-0.013412164,0.028000832,0.044393476,-0.022432039,-0.0041700588,0.0015907335,0.00193143,-0.018641077,-0.013229151,-0.013686681,-0.029281916,-0.0098303575,-0.0014608278,0.020118246,0.014967765,-0.014575597,0.007274726,-0.0018546303,0.024366736,-0.010235598,0.018392703,0.0043073175,0.026301436,-0.013935055,0.015660597,0.006199531,0.021229388,0.03375264,0.013065748,0.033700347,-0.011255236,-0.01021599,0.011111441,0.021307822,0.013516742,-0.0069675273,-0.0051537477,0.014288006,0.0008831962,-0.03027541,-0.0045785676,-0.010150628,0.007052497,0.00037256008,0.00029167533,0.005297543,0.009621201,-0.016641017,-0.002674916,0.0024232746,-0.021490835,-0.015412223,0.027399506,-0.03532131,-0.0043596067,-0.011196411,0.02054963,-0.0073400876,0.03278529,-0.021673847,0.011941532,0.020967944,0.021726135,-0.0027402774,0.001982085,0.010032978,-0.012261802,-0.0048596216,0.009712707,0.001336641,-0.098878756,-0.013425236,0.005804094,-0.037569743,0.014444874,0.013582103,0.008019846,-0.019255474,-0.0071309307,-0.026981194,-0.011000327,0.021307822,-0.016732523,0.014131139,-0.021320894,-0.046615764,-0.00813096,0.00059724,-0.0023791557,-0.017817523,-0.016967824,0.041857455,-0.04028878,-0.0023301346,-0.005470751,-0.037177574,0.025778543,-0.018745655,-0.0031651268,-0.016327282,-0.014274934,-0.00975846,0.006088416,-0.00079904334,-0.009287857,-0.012222585,0.023856917,-0.0011936629,0.004375947,0.021255534,-0.0062877685,-0.02529487,0.0019526724,-0.010150628,0.014065778,0.015307644,0.014157283,-0.0069675273,0.025033424,-0.004787724,0.017085476,-0.00088809826,-0.013503669,0.030066254,-0.03113818,0.006676669,0.02998782,-0.007457738,0.021033306,-0.019255474,0.032314684,-0.008065599,0.012013429,0.013386019,0.018222764,-0.0028628302,0.00014992275,0.015634451,0.0028938768,0.0076930393,-0.01694168,-0.009163671,0.013104965,0.022562763,0.021634629,-0.0041308417,0.004892302,-0.0042092754,0.0049413233,0.01316379,-0.009993761,-0.012948098,-0.050746605,0.029830951,-0.008771502,-0.021425473,0.008052527,-0.0065230695,0.036497816,0.009941472,0.016183488,-0.0153860785,0.030458422,0.01004605,0.0007728988,0.005186429,0.012372917,0.029543363,0.027216496,-0.0055001634,-0.022418967,0.0037092606,0.008621171,-0.026223002,0.011974212,5.545508e-05,-0.019307764,-0.02054963,0.018052824,0.009993761,-0.035269022,-0.017726017,0.0021340502,0.039530586,-0.014706319,0.013778187,0.013712826,-0.05351793,-0.028994326,0.008921834,0.0047060223,0.018131258,-0.015765175,-0.006215871,-0.034301672,-0.018967884,0.030955167,-0.0023301346,0.0018284858,-0.009091773,0.009085237,-0.0032876795,-0.042563356,-0.0098368935,-0.008477376,0.017765233,0.0041667903,-0.021033306,-0.008549274,-0.008222466,-0.010758489,0.01556909,0.025281796,-0.007974093,-0.01648415,-0.034667697,-0.0006867034,-0.0036569715,9.298683e-05,0.022066016,0.0013603346,0.0034837637,-0.018340414,0.005477287,0.026484447,-0.026510593,-0.00955584,0.025909267,-0.002954336,-0.021830713,0.017451499,0.029700229,0.02781782,0.0020964674,-0.028602157,-0.042615645,-0.0019575746,-0.047530822,0.018235836,-0.024719689,-0.005627618,0.016954752,-0.0013284709,0.013111501,0.02753023,0.005804094,0.0016397546,-0.0025245848,0.012470959,-0.0011634333,0.00074307766,0.027373362,0.030118542,-0.015124632,0.033151314,-0.024549749,-0.0049968804,-0.023909207,0.036706973,0.01024867,0.0010882677,-0.0051472117,0.014575597,0.022902641,0.024222942,0.0397136,0.046432752,-0.014327223,0.0060099824,0.0046275887,-0.0025441933,0.03960902,-0.017726017,0.008503521,0.005124335,-0.027974688,-0.008627707,0.017569149,0.028497579,0.025177218,0.005934817,-0.0050328295,-0.017843667,0.00533676,0.025190292,0.0068825576,0.003911881,-0.009170207,0.010941502,0.0071832202,-0.022405894,0.007150539,-0.00039829616,-0.0010343444,0.016327282,-0.018235836,0.008248611,-0.060341664,0.008987195,-0.012667043,-0.013477525,-0.023255592,-0.013948127,0.013255296,-0.024510533,-0.0007038608,0.023190232,-0.014601741,0.007908732,-0.024981134,-0.0049478593,0.032105528,-0.0073989127,-0.0404195,-0.0118304165,-0.01482397,-0.032942157,0.024758905,0.007032889,-0.0329683,-0.003223952,0.019791437,-0.0045818356,0.006297573,0.003176565,-0.013647464,-0.0037909623,0.012549393,0.0072943345,0.008804183,-0.00433673,0.022392822,-0.0004828575,0.003820375,0.022902641,0.027138062,-0.01573903,0.004970736,-0.007372768,0.048681185,-0.0043596067,-0.0009117918,-0.020706497,-0.03908613,0.015425295,-0.01973915,0.01573903,-0.039452154,0.011987285,0.030667579,-0.011510146,-0.00847084,-0.009431653,-0.0118565615,-0.010882677,0.0032157819,-0.011268308,-0.026850471,-0.010686592,-0.009653882,-0.027556375,-0.015163849,0.011229092,-0.0045851036,-0.03113818,0.022628123,-0.0235824,-0.03254999,0.005238718,-0.021843787,-0.017477643,-0.0030670846,0.0021569268,-0.03835408,0.017072402,-0.012791229,0.0047615794,-0.025791615,0.005072046,0.0073400876,0.003542589,0.026654387,0.011719302,-0.014928549,-0.005712588,0.010157164,0.013059212,-0.014065778,0.0098368935,0.00017249287,-0.0028383196,-0.010725809,0.024628183,0.015268427,-0.002300722,0.014183428,0.028079266,0.0030801569,0.03845866,-0.016222704,-0.021765353,0.012791229,0.048210584,-0.012693187,-0.0013611516,-0.01905939,0.01929469,-0.0009730681,-0.045883715,0.019726077,0.017660655,-0.019150896,0.04125613,-0.013712826,0.023451677,0.024262158,-0.025909267,0.0021503908,-0.005428266,-0.0013513473,0.002171633,0.015320716,-0.0187718,0.029491073,0.014104994,-0.009934936,0.012542857,-0.0259877,0.020745715,-0.01273894,-0.020614991,0.016889391,-0.012667043,0.02192222,0.0050459015,-0.011484002,0.0019003833,-0.0059969104,0.016235776,0.030170832,0.009680026,-0.020523487,0.032027096,0.025660893,0.020235896,-0.017948246,0.04138685,-0.0066211117,-0.00955584,-0.010575478,-0.0017124692,-0.01250364,0.00013296964,-0.008686532,0.042955525,0.012588609,0.009915328,0.01204611,-0.00052125735,-0.025543243,-0.012555929,-0.007778009,0.012784693,-0.010425147,0.018222764,-0.013673609,-0.0021307822,-0.015320716,-0.036654685,-0.006313913,-0.025373302,0.022510473,-0.02112481,0.012202977,-0.022471257,-0.018157402,-0.025660893,0.020157462,-0.03176565,0.023190232,0.011444785,-0.00570932,-0.016039692,-0.011438249,-0.012019965,0.019098606,-0.0019477702,-0.0011201313,0.00054290827,-0.016680235,0.0016928607,0.0038922725,-0.009209424,-0.00984343,0.021660775,0.023190232,-0.008706141,0.0017647584,-0.0004326109,0.010699664,-0.008536201,0.0028873407,0.010144092,-0.0037974985,-0.0038399834,0.0019461362,-0.027321074,0.0009232301,0.0032762412,0.008686532,-0.0049838084,-0.039007694,0.0018971153,0.0046602692,-0.00028902004,-0.0067975875,-0.016444933,-0.03451083,0.0068368046,0.006019787,0.0036144864,-0.013261832,-0.018353486,-0.029883241,-0.07095636,0.0031700288,-0.018680293,-0.004143914,-0.010614694,0.013660537,-0.020314328,-0.0153730055,-0.021935292,0.0032435604,0.015176922,0.014719391,-0.011444785,-0.015621379,0.0026013844,0.02449746,0.005078582,0.009065629,0.026118424,-0.014248789,-0.016837101,-0.011235628,0.0044870614,0.008745358,-0.0009542767,-0.008242075,0.00069487357,-0.035242878,0.0018791409,0.008836864,0.01643186,-0.010399002,-0.015503729,0.009608129,0.009006804,0.010745417,0.0074315933,0.007209365,0.018811017,0.0038399834,0.001611159,0.035269022,-0.00764075,0.006987136,-0.007215901,0.00889569,0.015346861,-0.04125613,0.030066254,0.03989661,0.037360586,0.022549689,0.014680175,-0.02220981,0.020445053,-0.033072878,0.008425087,-0.017726017,0.01373897,-0.009608129,-0.0032974835,-0.006941383,-0.014392585,-0.0015245551,-0.013804331,-0.021373184,0.008183249,0.015412223,0.013948127,-0.0075165634,-0.010869605,-0.006124365,-0.010555869,-0.011784664,-0.010255206,0.0077976175,0.009006804,0.0022141181,-0.01717698,-0.015595235,-0.0019069194,0.00789566,-0.03278529,0.017438427,0.01734692,0.014065778,0.018797943,-0.046040583,0.0016127931,-0.011196411,0.025856977,0.0286283,0.013529814,-0.011523218,-0.0007720818,0.017163908,0.016850173,-0.018654149,-0.01973915,-0.017020114,-0.027268784,-0.00835319,0.020065956,0.018562643,0.0024069343,0.01499391,0.015150777,0.004460917,0.0187718,-0.019778365,-0.01843192,0.024719689,-0.0035099082,0.048210584,0.0007700392,-0.0036504352,-0.012392526,-0.008882617,-0.0063760066,0.027765531,0.03142577,0.019425415,-0.04967468,0.012444815,0.01734692,-0.00015359934,0.0043596067,-0.0038759322,0.025909267,-0.031451914,-0.017895957,0.017569149,0.01802668,-0.0040360675,-0.015490657,-0.01699397,-0.006630916,0.0257524,-0.0046373927,-0.029491073,-0.01682403,-0.01677174,0.0024559554,0.017477643,-0.004748507,-0.01728156,-0.015712885,-0.009483942,0.03566119,0.035295166,-0.031112036,-0.022235954,0.00625182,0.013974272,-0.026523665,0.018497283,-0.0016724353,-0.016980898,-0.026183784,0.011699694,0.032105528,0.0153599335,-0.0020376423,0.0066243797,-0.022575835,-0.006255088,-0.013425236,0.029752519,-0.007934877,-0.0010776464,0.005343296,0.02507264,-0.016980898,-0.018536499,0.042040464,0.019543065,-0.0014355002,0.0093140025,0.0029167533,0.00016115676,0.007778009,-0.004290977,-0.016340354,0.028183844,-0.026000774,-0.014523308,-0.009274785,0.01963457,0.03960902,0.04052408,-0.008647316,0.015203066,0.0103401765,-0.008980659,0.019503847,0.021307822,-0.009549303,-0.005107995,0.018876377,0.012614754,0.018536499,-0.013895838,0.019373124,0.021673847,-0.02158234,-0.027582519,-0.014144211,-0.010098339,0.0027419114,0.0103336405,-0.028732881,-0.0036144864,0.0021471225,0.020105172,-0.013137645,0.0006184824,-0.003993583,-0.032602277,-0.020824147,-0.03492914,-0.017294632,0.025321014,-0.0028759025,0.002251701,-0.003402062,0.003176565,0.008451232,-0.013555959,0.011431713,-0.027713241,-0.007601533,-0.01465403,-0.008327045,0.013209543,-0.01282391,-0.00069691613,0.011052616,0.02902047,-0.0056112777,-0.016967824,0.024196798,0.0059511573,0.041360706,0.010987255,-0.0025588996,-0.00010090169,0.020170534,-0.005300811,0.013229151,0.021726135,0.0071701477,-0.00789566,0.00533676,0.02580469,0.02615764,-0.004464185,-0.0077976175,-0.0235824,-0.013817404,0.0065655545,-0.004343266,-0.021556197,0.019935234,0.00984343,-0.014627886,0.032183964,-0.016536439,0.013935055,-0.028079266,-0.01104608,0.010242134,0.024680473,-0.004967468,-8.650175e-05,-0.017608367,0.0013979174,-0.008778038,-0.027556375,-0.04889034,-0.0039249533,-0.010006833,0.027007338,-0.043033957,-0.011660477,-0.011582044,-0.017882884,0.020131318,-0.02592234,-0.00947087,0.032131676,0.026641315,0.00028084984,0.020445053,-0.0012802668,-9.314002e-05,0.002759886,0.00054576783,0.007993702,-0.0061112926,0.0041406457,-0.010170237,0.0033040198,0.029961675,-0.014301078,-0.01282391,0.045700703,0.040314924,-0.047818415,-0.00024530958,-0.013274904,0.009268249,-0.011699694,-0.004464185,0.018863305,-0.016536439,0.0050916546,-0.013235687,0.022275172,-0.014131139,-0.013170326,0.0071243946,0.013830476,0.03662854,-0.027347218,0.0047517754,0.009438189,-0.003630827,-0.012372917,0.00049021066,0.0017533201,-0.03349119,-0.03085059,-0.024458243,-0.0007704477,0.022667341,0.01453638,-0.0060557355,0.0074838824,-0.0108107785,-0.012124543,-0.003826911,0.0066930093,-0.019386197,-0.022562763,0.0048204046,0.026706677,0.032576133,0.02844529,0.022798063,0.0066799372,-0.0024330788,-0.024968062,0.0010637571,0.005745269,-0.006947919,-0.0018186815,-0.004826941,0.007372768,0.025451737,-0.017686801,-0.050798897,-0.0067975875,-0.0052583264,0.010405538,0.011052616,-0.0026798183,0.0020507146,0.013608248,-0.002258237,-0.0012206245,-0.0037190649,-0.0068368046,-0.011117977,-0.014261861,-0.02026204,-0.044733357,0.0033955257,-0.014065778,0.014575597,0.0035197125,-0.024758905,-0.008006774,-0.010196381,-0.0030098935,0.01968686,0.011765055,0.0032893135,0.010523189,-0.014484091,-0.006036127,-0.015072343,0.013974272,0.0035295167,-0.00040993866,0.019909088,-0.0123271635,0.010778098,-0.030589145,-0.009000268,-0.0214124,0.01545144,0.013830476,0.005467483,0.014157283,0.020471197,0.006140705,-0.009457798,0.036184084,0.0043073175,-0.014771681,-0.020758787,0.01196114,-0.027582519,0.011523218,-0.016444933,0.0329683,0.0113467425,0.0098303575,-0.026510593,0.021778425,0.0077584004,0.017320776,-0.018784871,0.0029216555,0.037595887,0.003866128,0.02420987,-0.029098904,-0.0011814077,-0.0018677026,-0.01951692,-0.00011417823,-0.002818711,0.0023366706,0.016588729,-0.025111858,-0.00460798,0.02902047,-0.007137467,-0.026824327,0.010170237,-0.018902523,0.00089136633,-0.007274726,-0.02632758,0.00022856072,-0.029543363,0.0036994563,0.025138002,-0.018235836,0.0012034671,0.005761609,-0.0002675733,0.010000297,0.0033922577,0.0014355002,-0.0074315933,0.0028742685,0.0013921983,0.010451291,-0.0016454738,0.0064675123,-0.0012279777,-0.009196351,0.0053596366,0.02020975,0.010921894,0.0046439287,0.013542886,0.010869605,-0.011948068,-0.008483912,0.04005348,-0.0024069343,0.023948424,-0.013091892,-0.005206037,0.00433673,-0.008444696,0.0019232598,0.006258356,0.012425206,-0.024340592,0.0071962923,0.0022664072,-0.0033056538,0.0077649364,0.016980898,0.015333789,0.012693187,-0.030824445,0.0059250128,0.023869991,-0.01150361,-0.0043465346,0.004503402,-0.027085772,-0.0043955552,0.011366351,-0.015961258,0.012497104,-0.019713005,-0.004826941,-0.029177338,-0.02197451,-0.00821593,-0.005026293,0.016889391,0.005800826,0.020758787,0.012235657,0.020118246,0.008229002,0.0076342137,-0.023621617,0.032811433,-0.008229002,0.016745595,-0.017869812,-0.030013964,0.012065718,-0.005791022,0.01677174,-0.005712588,0.0024510531,-0.019373124,-0.008621171,0.015922042,0.019752221,-0.013386019,-0.008980659,-0.018536499,0.0009142429,-0.0012917051,0.014575597,-0.0098042125,0.00064421847,0.0062714284,0.027294928,0.000622159,-0.013882766,-0.0012680115,-0.021595413,0.01631421,0.00598057,-0.022026798,0.011575507,0.008124424,-0.0023660834,-0.008921834,0.016353427,-0.013425236,-0.016052764,0.0029281916,0.008725749,0.00598057,-0.0037419412,0.0009526427,0.028549869,-0.00037133455,0.015124632,0.010647375,-0.0045426185,-0.0033268963,0.0030964972,0.0049445913,-0.016157342,0.0019575746,0.008961051,-0.009176743,-0.00070549484,0.002163463,0.00038726642,-0.0025997504,-0.013412164,-0.0026291632,-0.031059746,-0.017543005,-0.027294928,0.018118186,0.006304109,-0.0009632639,0.016928608,-0.016222704,0.0044249683,0.0014363172,-0.0011348376,-0.012569001,-0.013353338,-0.006823732,-0.0065720906,-0.009627737,-0.0012712796,-0.004330194,0.01607891,-0.04321697,-0.013098428,-0.010196381,0.021830713,0.01273894,-0.0006029591,-0.02158234,-0.007784545,-0.01929469,0.00672569,-0.01797439,-0.008542738,0.0153599335,-0.00055148697,0.014144211,0.00093630236,0.013085356,-0.011993821,-0.017268486,0.012490567,-0.013582103,0.028968181,0.0023791557,0.009621201,0.03090288,-0.009255177,-0.011797736,0.01499391,-0.0093859,-0.005938085,-0.026772037,-0.0026814523,-0.0060165185,0.003640631,-0.0072028283,0.016052764,0.010948038,0.002348109,0.0045916396,0.012771621,-0.008549274,-0.012693187,-0.027765531,0.014104994,-0.0045426185,-0.00078923913,-0.020562703,0.027451796,-0.007902196,-0.008235539,-0.008751894,0.0015964527,0.0035818059,0.017085476,0.005121067,0.021634629,-0.0015122999,-0.0005939719,0.033517335,0.017778305,-0.007261654,0.0022860155,-0.009366292,-0.033177458,0.017085476,0.0045949076,-0.00386286,-0.019163968,0.0071766838,-0.02197451,0.010621231,0.005013221,0.008111352,-0.015582162,0.008719213,0.02993553,0.021046378,-0.005297543,0.0005849847,-0.006941383,-0.005255058,0.011392496,0.00074307766,0.0006993672,-0.001890579,0.00039196428,0.0018971153,-0.0013554324,-0.0016650822,0.012438278,0.019216258,0.0010343444,0.020248968,0.002071957,0.0025981164,-0.0038857365,-0.0113336705,0.0072551174,-0.030144686,0.007457738,0.040968537,-0.0042582965,-0.00672569,0.01499391,0.0057223924,0.018183546,0.0077126473,-0.011176803,0.00421908,0.014497163,0.011490538,0.0032615347,-0.024732761,0.008085208,-0.005931549,0.031844083,0.008268219,0.024575893,0.014026561,-0.018523427,-0.005990374,0.019255474,-0.015595235,0.025138002,0.023334026,0.0017696604,-0.022484329,0.008444696,0.0020670549,-0.0006781247,-0.00867346,-0.025687037,-0.010379394,-0.0007965923,0.0061733862,-0.0036635075,-0.0017108351,0.017686801,-0.027138062,-2.775307e-05,0.012758549,-0.017608367,0.009124454,-0.0048530856,0.018418849,0.009549303,-0.02324252,-0.0059478893,-0.0047648475,0.0016642652,0.018092042,0.0044935974,-0.019987522,0.013490597,-0.0123533085,-0.012261802,0.0034674234,-0.012340236,-0.020928727,0.013712826,0.0011903949,0.013490597,-0.019713005,-0.0062224073,-0.0098042125,0.0048661577,-0.0031700288,0.017529933,0.015425295,0.0010032977,-0.0059609613,0.0073074065,-0.00570932,0.010529725,-0.0013497133,-0.0064315638,0.027138062,0.013595175,0.025216436,0.008915298,-0.01262129,0.004826941,-0.0019673787,-0.0021356845,0.01894174,-0.009640809,-0.023987642,-0.004058944,-0.01345138,-0.0038105708,-0.009601592,0.007457738,0.00764075,-0.013948127,-0.006444636,0.006480585,0.015556018,-0.024654327,-0.011196411,0.0042615645,-0.0019396001,-0.0209418,-0.013608248,-0.004173327,-0.00030944546,0.005977302,0.0045328145,0.020039812,-0.018928668,0.00017872264,-0.0047092903,-0.006526338,-0.021399328,0.0070721055,0.0061178287,-0.008333581,0.0010261743,-0.0016274994,0.011758519,0.0018513622,0.006140705,-0.01905939,-0.002302356,0.009065629,-0.010915357,0.015176922,-0.0009624469,-0.018654149,0.020013666,-0.00011999948,-0.009993761,-0.00060500164,-0.002483734,-0.014954693,-0.003728869,-0.0061145606,0.011510146,-0.0051504797,-0.007052497,0.03268071,0.008987195,0.0064381,-0.012987314,0.006170118,-0.007908732,-0.010222526,-0.0043955552,-0.01665409,-0.015464512,-0.001424062,-0.005107995,-0.020405835,0.01204611,-0.01734692,0.0066701327,0.009908792,-0.0068302685,0.0003343645,0.019699931,0.035974924,-0.02375234,-0.010921894,0.0020490806,-0.018458065,-8.568473e-05,-0.006026323,0.025268724,0.016497223,0.005970766,-0.0083009,-0.023569329,-0.051713955,-0.00075574144,-0.018994028,-0.0040916246,0.010366322,-0.019647643,0.009732315,-0.009562376,0.0061733862,-0.009412045,-0.0044380403,-0.014000416,-0.012902345,0.009595056,0.009372828,0.008581954,0.01946463,-0.007209365,0.009601592,-0.013542886,-0.029334204,0.013921983,0.0045981756,0.003725601,-0.011412104,0.008575418,-0.008137497,0.0018333878,0.012052646,0.010372858,0.001475534,0.0022206542,0.023569329,-0.0014346831,0.016209632,0.0052289134,-0.022981076,0.020876437,-0.0062714284,0.011778127,-0.00016136101,-0.0036733118,0.025438664,-0.031922515,0.009307466,0.009157135,0.0011438249,0.013261832,-0.042458776,-0.0010171871,0.0118304165,-0.005745269,-0.00312591,0.009457798,-0.0071897563,0.010111412,-0.018784871,-0.029151194,-0.0020670549,-0.03153035,0.008575418,0.00569298,-0.004101429,-0.014065778,-0.0067518344,-0.0007643201,0.0018235836,0.006134169,-0.011810808,0.015346861,0.007967557,0.010863068,-0.005856383,0.012399062,0.017242342,-0.019791437,-0.017490717,0.008242075,-0.030406132,0.006823732,-0.0034249383,0.00022427137,0.005581865,-0.008425087,0.013059212,0.018288124,-0.042092755,0.015033127,-0.016732523,-0.0021405865,0.013921983,-0.036210228,9.426342e-05,-0.0075296354,0.01917704,-0.017843667,0.000527385,0.034484684,-0.021608485,0.0077976175,0.013046139,-0.00133419,0.0027909325,-0.0017386137,-0.033621915,-0.010019906,-0.0027255712,0.0050328295,0.005255058,0.01814433,-0.00835319,-0.024798123,-0.014797825,0.012712796,0.018614933,0.024758905,-0.00506551,-0.015216138,-0.018327342,-0.01328144,-0.0023677174,-0.0065524825,0.025974628,0.021634629,0.00013368453,0.0029330938,0.007934877,0.0012328798,0.0073923767,0.004009923,-0.015412223,0.017373065,0.041465286,0.017987462,-0.015268427,-0.0064315638,-0.004447845,-0.00030066253,0.0044413083,0.015425295,0.025425592,-0.00059111236,0.0066930093,0.030955167,-0.0103336405,0.010006833,0.016013548,0.0138696935,0.01619656,-0.0056766393,-0.00843816,-0.0005653763,0.0059446213,-0.007876051,-0.0011209483,0.016039692,-0.0035164445,0.016366499,0.0108107785,-0.011987285,0.0037550135,0.018458065,0.036262516,0.009111382,0.002480466,0.020798003,0.026406014,-0.013725898,0.0015114829,-0.01138596,-0.0032092456,-0.005755073,0.014209572,-0.008993731,-0.006706082,-0.00755578,0.02237975,-0.0063302536,0.0032942155,0.006647256,0.005578597,-0.0066178436,-0.012680115,0.007215901,0.0032272201,-0.0113336705,0.018092042,0.007333551,-0.036942273,0.016327282,-0.019830655,-0.007862979,-0.022392822,-0.018418849,-0.016497223,-0.013660537,-0.0023644494,-0.015752101,0.004552423,0.006487121,-0.0074838824,0.009065629,0.004967468,-0.031164324,-0.0077649364,0.019869871,-0.0033301644,-0.01228141,0.00709825,-0.006483853,-0.020981016,-0.013830476,-0.0035327848,0.010392466,-0.014392585,0.0026046527,0.019621499,0.017490717,0.028000832,-0.011510146,0.016444933,0.015686741,-0.00230399,-0.009019876,-0.020902582,0.0200921,-0.008039455,0.0044249683,0.030615289,-0.036027215,0.015556018,-0.0031373482,0.0053531,-0.000667912,0.004745239,0.00018505452,0.014915476,-0.012797766,0.014732464,0.001704299,0.024667399,-0.0074708103,-0.019961378,-0.0031046674,-0.009634273,-0.0019559404,-0.0016944949,0.011261772,0.013248759,0.008568882,-0.0027958348,0.006202799,-0.009562376,0.00930093,0.0042484924,-0.0014779851,-0.008026382,0.016392644,-0.005241986,0.0128369825,-0.0033089218,-0.00063400576,0.012542857,0.008745358,0.0016176951,-0.008366262,-0.00755578,0.0030540123,-0.0033089218,-0.0057746815,0.0033497727,-0.018837161,-0.010915357,0.0056439587,0.022013726,0.018980956,0.0018056092,-0.02146469,-0.008706141,0.0067387624,0.00764075,-0.0067518344,0.0017680264,-0.006856413,0.003957634,0.012131079,-0.005536112,0.010314032,-0.014745536,0.009248641,-0.00036377716,0.009771532,0.013046139,0.008947979,-0.006196263,-0.0017696604,-0.012562465,-0.0030327698,-0.0078368345,-0.0018971153,-0.0059446213,-0.013386019,-0.010621231,-6.7340134e-06,0.014026561,-0.028183844,0.009091773,0.036889985,0.0040752846,-0.0011005229,0.02071957,0.009235568,-0.011653941,0.009235568,-0.005696248,-0.00570932,0.0036733118,-0.0056537627,0.012484031,0.0015449806,0.0048988382,-0.0059152083,-0.013935055,-0.0030834249,-0.015020054,0.006578627,-0.017961318,0.012438278,-0.023909207,-0.0040229955,-0.008222466,-0.0036046824,-0.029464928,0.0065099974,-0.0013742239,-0.0055491845,0.023072582,-0.00921596,-0.010052586,0.007281262,-0.006075344,-0.007411985,0.008581954,0.0062779645,-0.010314032,-0.0093859,-0.022824207,-0.0051504797,-0.030563,-0.016274994,-0.0051472117,-0.0046406607,0.007379304,-0.022222882,-0.01797439,0.02105945,-0.0076930393,-0.0010743784,-0.004183131,0.0006094952,-0.013157254,-0.01204611,0.018275052,-0.0038890045,0.0007320479,0.010765025,0.0060132504,0.0026455035,0.015216138,0.024458243,-0.015307644,0.011902315,0.03485071,-0.0048726937,0.012157224,0.00022876497,-0.0039870464,0.017686801,0.012444815,-0.0014379512,0.007045961,0.0036177547,0.0033465046,0.0050328295,-0.0021814373,-0.0038988087,-0.004042604,0.006490389,-0.012294483,-0.008274755,-0.002116076,0.002616091,0.015333789,-0.02392228,-0.0019543064,-0.018667221,-0.018980956,-0.023569329,-0.007778009,0.010379394,0.0003317092,0.013268368,0.004565495,0.015163849,-0.005529576,0.0075753885,-0.004238688,-0.02529487,0.0036700438,-0.021360112,-0.025713183,-0.011327134,0.008072135,-0.0064609763,0.0011487269,-0.015085416,-0.0069283103,-0.004107965,0.0034641551,-0.02295493,-0.008725749,0.014614813,-0.010320568,0.0007398096,0.017072402,-0.018902523,0.0048171366,-0.003408598,-0.007608069,0.002674916,-0.010268279,0.014405657,0.018078968,-0.010915357,0.018183546,-0.036105648,0.0039805104,0.005395585,0.0107062,0.019399269,-0.013895838,0.00423542,-0.017020114,-0.001012285,0.0011160462,-0.015020054,-0.020680353,-0.025059568,-0.007372768,0.0138696935,0.019869871,0.021320894,0.0010948038,0.013019995,-0.017425355,0.017621439,0.00026164993,0.010235598,0.013582103,0.027634809,0.00027635627,-0.0008317241,0.0049413233,0.0024183725,0.02300722,-0.017359992,-0.0015449806,0.000118773954,0.0045262785,0.014732464,-0.02346475,-0.014706319,-0.0075165634,0.020366618,0.0009428385,-0.003728869,0.01104608,0.005016489,0.009634273,0.003996851,0.0062224073,-0.005849847,-0.011725838,-0.0038105708,0.0030000892,-0.0048988382,-0.00085786864,0.013255296,0.013516742,0.016183488,0.0036275587,0.0068302685,-0.0018219496,-0.0006985502,-0.008536201,0.0075230994,0.0026013844,-0.00479426,0.006362934,0.0034903,0.009640809,-0.002480466,-0.0045230105,0.0017124692,-0.024549749,-0.018078968,0.031164324,-0.014183428,-0.0049805404,-0.018340414,-0.004611248,-0.007313943,-0.03811878,-0.0038497876,0.014640958,0.007274726,-0.020314328,0.0037582817,0.014837042,0.03989661,-0.007843371,0.011019935,0.008085208,0.004290977,-0.013987344,-0.029700229,0.005706052,0.003954366,-0.006915238,-0.0108303875,0.0054053892,-0.007908732,-0.004382483,0.0020899314,0.014431802,-0.003183101,-0.0133337295,-0.004107965,0.025046496,-0.009039484,0.014680175,-0.0103336405,-0.0224974,0.015490657,0.010575478,0.013542886,-0.037674323,0.021268606,0.0044413083,-0.021164028,0.0074315933,0.009059093,-0.015085416,0.0023693515,0.00421908,0.012732404,-0.016497223,0.008235539,0.0035262485,-0.0005576146,0.0051635522,-0.0067975875,0.012928489,0.0028285154,-0.0030719866,0.027321074,-0.009908792,0.00069364806,-0.0066113076,0.0078302985,0.0019690127,-0.013144181,0.0003958451,0.0071766838,-0.00875843,0.000804354,-0.0041210377,-0.01067352,-0.015830535,0.015150777,-0.0076930393,-0.025739327,0.007843371,-0.005513236,-0.02488963,-0.011033008,0.0009150599,0.011405568,0.01024867,-0.0011593482,-0.008836864,0.0074708103,-0.036942273,0.028576013,-0.01677174,0.031112036,0.01946463,0.02329481,-0.00210954,-0.023713123,0.0042681005,0.007157075,-5.811039e-05,-0.018628005,-0.008934906,-0.0166018,0.014549452,0.00843816,-0.0036994563,-0.01216376,-0.004513206,-0.02883746,-0.0050818506,0.008601563,-0.032942157,-0.0024167385,-0.0022909178,-0.0044903294,-0.0028252474,-0.01067352,-0.013353338,0.010117948,-0.016614873,0.022706557,0.0067452984,0.015699813,0.014261861,0.017647583,0.02158234,0.0012320628,-0.004238688,0.00044772573,-0.0044805254,0.0062420154,0.0067845155,0.0010629401,0.01465403,0.0034478148,-0.009529695,-0.015686741,0.002619359,0.00024673936,0.021765353,0.009993761,0.005232182,0.015895898,0.027007338,-0.0027991028,-0.03898155,0.015438368,0.002848124,0.023778485,-0.0074773463,0.01141864,0.030536855,0.0055034314,0.019190112,0.007444666,0.012072254,0.013516742,0.01453638,0.01699397,-0.011948068,0.012209513,-0.006869485,-0.0006201165,-0.007104786,0.0030213315,0.004621052,0.01705933,-0.027007338,-0.0024036663,0.0036635075,0.002256603,-0.0037190649,-0.0005204403,-0.008568882,0.010640839,0.006676669,0.0108173145,-0.012902345,-0.008085208,-0.005804094,-0.005075314,0.010699664,0.004290977,0.021686919,-0.031791795,-0.024811195,-0.020052884,-0.008849937,-0.02930806,0.0099284,0.021935292,-0.0053825127,-0.017647583,0.0113205975,-0.021098666,0.0041373777,-0.012765085,-0.012987314,-0.017033186,0.0028857067,0.016797885,0.0148762595,-0.0006291037,0.0035327848,0.033674203,-7.286777e-05,-0.011627796,-0.0063760066,-0.0062322114,-0.02907276,0.01819662,-0.0053661726,-0.027843965,-0.0118500255,0.012497104,-0.0044870614,0.0019837192,-0.009961081,0.011784664,0.028262278,-0.035635047,0.0062452834,-0.0083074365,-0.012719332,0.004745239,0.0057812175,0.03445854,-0.011549363,-0.030066254,-0.00477792,-0.038040347,0.0023595472,-0.0035720016,-0.006526338,0.016536439,-0.0018023412,0.021791497,0.008006774,-0.005464215,-0.006817196,0.014523308,-0.014157283,-0.0032435604,0.005127603,0.019935234,0.022562763,-0.0012124543,-0.01241867,0.01390891,-0.009771532,0.0077126473,0.02180457,0.003630827,-0.011967676,0.0015980867,0.0041210377,-0.026118424,-0.03417095,0.0224974,-0.019477703,-0.018837161,0.0023693515,0.007588461,0.0067845155,-0.03153035,-0.018301198,0.0070655695,0.010680056,0.020052884,0.021791497,-0.0046308567,0.0118434895,0.009444725,0.000110195266,0.0014395852,-0.006068808,-0.008797647,-0.00097061705,-0.020327402,-0.0069348468,0.009477406,0.008908762,-0.01860186,-0.0018105113,0.003037672,0.0006495291,-0.007320479,-0.010052586,-0.0153599335,-0.009614665,-0.0016454738,0.0008215113,0.0015743932,0.0017222734,-0.005300811,0.022131376,0.016680235,-0.021307822,-0.012235657,0.01465403,-0.027059628,0.020575775,0.01590897,-0.025517099,-0.011967676,0.0021471225,-0.0026994266,0.0053759767,-0.0128631275,0.0118238805,-0.00406548,-0.0030033572,0.0014150747,0.028602157,0.00835319,-0.0015319083,0.042615645,-0.00023999896,0.0128565915,0.012601682,0.00979114,0.0037027244,0.005075314,0.02129475,-0.014706319,-0.0128500555,-0.0032517307,0.0010449657,0.008634243,-0.0108173145,0.011451321,-0.010895749,0.021307822,-0.005862919,-0.0004277088,0.01607891,-0.011359815,0.00813096,-0.0038399834,0.015582162,0.020418907,-0.0123533085,0.0067452984,0.0015940017,-0.028863603,0.042903237,-0.005617814,0.026772037,-0.00847084,0.007660358,-0.0064544403,0.007908732,-0.0013930153,0.008725749,-0.016641017,-0.0046243207,0.0013554324,-0.0023791557,-0.0037190649,0.03113818,-0.02014439,-0.0027860305,-0.00267655,0.014601741,-0.023778485,0.013274904,0.020954872,0.0077453284,0.0058857957,-0.0039184173,0.0033955257,-0.013647464,0.01687632,-0.0059119402,0.0050883866,-0.047530822,-0.0054053892,-0.004052408,0.0016928607,-0.0083401175,0.022941858,-0.002813809,-0.01013102,-0.004147182,-0.0036961883,-0.00838587,-0.028706735,0.0028007368,0.01116373,-0.012307555,0.0013921983,0.0045916396,-0.0021732673,-0.014261861,0.0026961586,-0.015595235,-0.0060524675,0.01092843,-2.67318e-05,0.03022312,0.016915536,-0.008144033,0.033465046,0.008444696,0.0015073977,0.026419086,0.007451202,0.00947087,0.013569031,-0.0044053597,-0.020706497,0.042903237,-0.006634184,0.00062420155,0.030746011,-0.0013497133,-0.021438546,0.0012238926,-4.725937e-05,0.011974212,-0.010222526,-0.029961675,0.0015082147,0.007862979,0.012595146,0.011216019,0.0017876348,-0.0019690127,-0.0012908881,0.024510533,0.00076717965,0.042275768,-0.021608485,-0.004379215,0.0103336405,0.011765055,-0.004826941,-0.010372858,-0.009987225,0.011405568,-0.02547788,-0.016458005,0.009503551,0.015137705,-0.014340295,-0.02695505,-0.004290977,-0.007921804,0.010882677,0.0051439437,-0.019909088,-0.020588847,0.02105945,-0.026876615,0.013490597,-0.007549244,0.019137824,0.037360586,-0.012000357,-0.018980956,0.021307822,0.0072420454,0.011895779,-0.021137884,-0.008719213,0.000577223,-0.013974272,0.022824207,-0.023935352,0.010483972,-0.013039603,-0.015229211,-0.006545946,0.006026323,0.04298167,0.008660388,-0.0020931994,-0.015150777,0.018183546,-0.008719213,0.01453638,-0.017085476,0.00011233994,0.018837161,-0.028863603,0.0013554324,0.0057714134,-0.01441873,-0.0011144122,-0.016222704,-0.012634362,-0.0128435185,0.011026472,-0.0033987937,-0.017660655,0.009549303,-0.020052884,0.00015656103,0.018510355,0.005902136,-0.0040295315,0.007157075,-0.021608485,-0.008431623,0.01050358,-0.0015564188,0.009451262,0.02415758,-0.0036798478,-0.01717698,0.0006630099,0.015229211,0.01187617,-0.0027484477,0.023072582,0.0078106895,-0.0006364568,-0.0224974,0.01677174,-0.013039603,0.019255474,0.024275232,-0.01694168,-0.0286283,0.004183131,-0.011536291,0.019203184,-0.0032860453,-0.0026455035,-0.02203987,-0.0009240471,-0.0061897263,-0.019543065,0.0039053448,-0.01319647,-0.008372798,-0.00026879885,0.020183606,-0.030458422,0.008993731,0.01431415,0.0037517454,-0.00867346,-0.028497579,0.0043007815,-0.011013399,-0.007588461,-0.0050916546,0.005075314,0.015869753,0.00672569,0.020105172,-0.0018480942,-0.018418849,0.008202858,-0.014549452,-0.01079117,0.0042484924,0.008516593,-0.011189875,0.0039772424,0.0072943345,-0.014484091,-0.015647523,-0.0043955552,0.012529784,-0.00523545,-0.006650524,0.0033791855,-0.0031716628,0.006029591,-0.0118304165,0.009425117,-0.002952702,0.020065956,-0.0077453284,-0.016118126,-0.018418849,0.0118304165,0.019150896,0.015778247,-0.016667161,0.004058944,0.0012247096,-0.022510473,-0.01968686,-0.014000416,0.007085178,0.003993583,0.0004934787,0.009379364,0.0025523633,2.5161593e-05,0.010274815,-0.023111798,0.020013666,0.018392703,-0.0019134555,-0.009091773,0.004281173,0.002021302,-0.029046616,-0.0068302685,0.0035916101,0.005398853,-0.001379126]
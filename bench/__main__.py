@@ -0,0 +1,75 @@
+import argparse
+import json
+import logging
+import sys
+from typing import get_args
+
+from api.database import SearchMode
+from bench.corpus import SIZES, load_corpus
+from bench.run import compare, run_benchmark
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog="python -m bench", description="Retrieval benchmarks for the history table")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    load = commands.add_parser("load", help="load a seeded synthetic corpus into history")
+    load.add_argument("--size", type=int, default=SIZES[0])
+    load.add_argument("--seed", type=int, default=42)
+    load.add_argument("--reset", action="store_true", help="delete the corpora of every seed first")
+
+    run = commands.add_parser("run", help="replay a query set and measure latency, qps and recall@k")
+    run.add_argument("--size", type=int, default=SIZES[0])
+    run.add_argument("--seed", type=int, default=42)
+    run.add_argument("--load", action="store_true", help="load the corpus before running")
+    run.add_argument("--target", choices=("function", "http"), default="function")
+    run.add_argument("--url", default="http://localhost:8000")
+    run.add_argument("--query-set", choices=("synthetic", "utils"), default="synthetic")
+    run.add_argument("--queries", type=int, default=100)
+    run.add_argument("--k", type=int, default=10)
+    run.add_argument("--max-distance", type=float, default=30.0)
+    run.add_argument("--concurrency", type=int, default=1)
+    run.add_argument("--warmup", type=int, default=5)
+    run.add_argument("--mode", choices=get_args(SearchMode), default=None)
+    run.add_argument("--ef-search", type=int, default=None)
+    run.add_argument("--oversampling", type=float, default=None)
+    run.add_argument("--output", help="write the JSON report here instead of stdout")
+
+    diff = commands.add_parser("compare", help="compare two reports, exit 1 on regression")
+    diff.add_argument("baseline")
+    diff.add_argument("current")
+    diff.add_argument("--max-latency-regression", type=float, default=0.1)
+    diff.add_argument("--max-recall-drop", type=float, default=0.01)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+
+    if args.command == "load":
+        load_corpus(args.size, args.seed, reset=args.reset)
+
+    elif args.command == "run":
+        if args.load:
+            load_corpus(args.size, args.seed)
+        report = run_benchmark(
+            args.size, args.seed,
+            target=args.target, url=args.url, query_set_name=args.query_set, query_count=args.queries,
+            k=args.k, max_distance=args.max_distance, concurrency=args.concurrency, warmup=args.warmup,
+            options={"mode": args.mode, "ef_search": args.ef_search, "oversampling": args.oversampling},
+        )
+        output = json.dumps(report, indent=2)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                file.write(output + "\n")
+        else:
+            print(output)
+
+    else:
+        with open(args.baseline, encoding="utf-8") as baseline, open(args.current, encoding="utf-8") as current:
+            problems = compare(json.load(baseline), json.load(current), args.max_latency_regression, args.max_recall_drop)
+        for problem in problems:
+            print(problem)
+        sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import logging
+from typing import Iterator
+
+import numpy as np
+from sqlalchemy import text
+from ulid import ulid
+
+from api.database import VECTOR_DIMENSIONS, engine
+from api.ingest import IngestRow, copy_batch
+from api.utils import vector_to_compare
+
+logger = logging.getLogger(__name__)
+
+SIZES = (10_000, 100_000, 1_000_000, 10_000_000)
+# every chunk gets its own seeded generator, so any prefix of a corpus is the smaller corpus with the same seed
+CHUNK_ROWS = 2000
+CLUSTERS = 256
+NOISE = 0.7
+CONTENT_PREFIX = "bench"
+
+
+def corpus_user(seed: int) -> str:
+    # every seed loads under its own user_id, so searches scoped to it only see that corpus
+    return f"{CONTENT_PREFIX}-{seed}"
+
+
+def content_for(seed: int, index: int) -> str:
+    return f"{CONTENT_PREFIX}:{seed}:{index}"
+
+
+def index_from_content(content: str, seed: int) -> int | None:
+    prefix = f"{CONTENT_PREFIX}:{seed}:"
+    return int(content[len(prefix):]) if content.startswith(prefix) else None
+
+
+def centroids(seed: int, dimensions: int = VECTOR_DIMENSIONS) -> np.ndarray:
+    centers = np.random.default_rng([seed, 0]).standard_normal((CLUSTERS, dimensions), dtype=np.float32)
+    return centers / np.linalg.norm(centers, axis=1, keepdims=True)
+
+
+def sample_vectors(rng: np.random.Generator, centers: np.ndarray, rows: int) -> np.ndarray:
+    dimensions = centers.shape[1]
+    assignment = rng.integers(0, len(centers), rows)
+    noise = rng.standard_normal((rows, dimensions), dtype=np.float32) * (NOISE / np.sqrt(dimensions))
+    return centers[assignment] + noise
+
+
+def corpus_chunks(
+        size: int,
+        seed: int,
+        start: int = 0,
+        dimensions: int = VECTOR_DIMENSIONS,
+) -> Iterator[tuple[int, np.ndarray]]:
+    centers = centroids(seed, dimensions)
+    for offset in range(start, size, CHUNK_ROWS):
+        rng = np.random.default_rng([seed, 1, offset])
+        # always draw a full chunk so the rows don't depend on where the corpus ends
+        yield offset, sample_vectors(rng, centers, CHUNK_ROWS)[:size - offset]
+
+
+def query_set(name: str, count: int, seed: int, dimensions: int = VECTOR_DIMENSIONS) -> np.ndarray:
+    if name == "utils":
+        return np.tile(np.asarray(vector_to_compare, dtype=np.float32), (count, 1))
+    if name == "synthetic":
+        return sample_vectors(np.random.default_rng([seed, 2]), centroids(seed, dimensions), count)
+    raise ValueError(f"unknown query set: {name}")
+
+
+def loaded_rows(seed: int) -> int:
+    with engine.connect() as connection:
+        return connection.execute(
+            text("SELECT count(*) FROM history WHERE user_id = :user_id AND content LIKE :pattern"),
+            {"user_id": corpus_user(seed), "pattern": f"{CONTENT_PREFIX}:{seed}:%"},
+        ).scalar_one()
+
+
+def reset_corpus(seed: int | None = None):
+    # one seed's corpus, or every bench corpus without a seed; rows outside the bench users are never touched
+    if seed is None:
+        condition, user_id, pattern = "user_id LIKE :user_id", f"{CONTENT_PREFIX}-%", f"{CONTENT_PREFIX}:%"
+    else:
+        condition, user_id, pattern = "user_id = :user_id", corpus_user(seed), f"{CONTENT_PREFIX}:{seed}:%"
+    with engine.begin() as connection:
+        connection.execute(
+            text(f"DELETE FROM history WHERE {condition} AND content LIKE :pattern"),
+            {"user_id": user_id, "pattern": pattern},
+        )
+
+
+def load_corpus(size: int, seed: int, reset: bool = False) -> int:
+    existing = 0 if reset else loaded_rows(seed)
+    if existing == size:
+        logger.info(f"corpus {size}/{seed} already loaded")
+        return 0
+    if reset:
+        reset_corpus()
+    elif existing > size or existing % CHUNK_ROWS:
+        reset_corpus(seed)
+        existing = 0
+
+    connection = engine.raw_connection()
+    try:
+        for offset, vectors in corpus_chunks(size, seed, start=existing):
+            indexes = range(offset, offset + len(vectors))
+            rows = [IngestRow(content_for(seed, index), user_id=corpus_user(seed)) for index in indexes]
+            copy_batch(connection, [ulid() for _ in indexes], rows, vectors)
+            logger.info(f"loaded {offset + len(vectors)}/{size} rows")
+    finally:
+        connection.close()
+
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE history"))
+    return size - existing
+
+
+def ground_truth(queries: np.ndarray, size: int, seed: int, k: int, max_distance: float) -> list[list[int]]:
+    # brute force over the regenerated corpus, keeping a running top-k per query so memory stays at one chunk
+    queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    best_distances = np.full((len(queries), k), np.inf, dtype=np.float32)
+    best_indexes = np.full((len(queries), k), -1, dtype=np.int64)
+
+    for offset, vectors in corpus_chunks(size, seed, dimensions=queries.shape[1]):
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        distances = 1 - queries @ vectors.T
+        distances[~(distances < max_distance)] = np.inf
+
+        merged_distances = np.concatenate([best_distances, distances], axis=1)
+        merged_indexes = np.concatenate(
+            [best_indexes, np.broadcast_to(np.arange(offset, offset + len(vectors)), distances.shape)], axis=1
+        )
+        keep = np.argpartition(merged_distances, k - 1, axis=1)[:, :k]
+        best_distances = np.take_along_axis(merged_distances, keep, axis=1)
+        best_indexes = np.take_along_axis(merged_indexes, keep, axis=1)
+
+    order = np.argsort(best_distances, axis=1, kind="stable")
+    best_distances = np.take_along_axis(best_distances, order, axis=1)
+    best_indexes = np.take_along_axis(best_indexes, order, axis=1)
+    return [
+        [int(index) for index, distance in zip(indexes, distances) if np.isfinite(distance)]
+        for indexes, distances in zip(best_indexes, best_distances)
+    ]
@@ -0,0 +1,178 @@
+import asyncio
+import resource
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import httpx
+import numpy as np
+from sqlalchemy import text
+
+from api.database import MemoryFilter, SessionLocal, engine, simples_distance_query
+from bench.corpus import corpus_user, ground_truth, index_from_content, query_set
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def latency_summary(latencies: list[float]) -> dict:
+    milliseconds = np.asarray(latencies) * 1000
+    p50, p95, p99 = np.percentile(milliseconds, [50, 95, 99])
+    return {
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99),
+        "mean": float(milliseconds.mean()),
+        "max": float(milliseconds.max()),
+    }
+
+
+def recall_at_k(retrieved: list[list[int]], truth: list[list[int]], k: int) -> float | None:
+    scores = [
+        len(set(found[:k]) & set(expected[:k])) / len(expected[:k])
+        for found, expected in zip(retrieved, truth)
+        if expected
+    ]
+    return float(np.mean(scores)) if scores else None
+
+
+def search_function(query_vector: list[float], k: int, max_distance: float, user_id: str, options: dict) -> list[str]:
+    filters = MemoryFilter(user_id=user_id)
+    with SessionLocal() as session:
+        return [
+            row.content
+            for row in simples_distance_query(session, query_vector, k, max_distance, filters=filters, **options)
+        ]
+
+
+def run_function(queries: np.ndarray, k: int, max_distance: float, concurrency: int, user_id: str, options: dict):
+    def timed(query_vector):
+        started = time.perf_counter()
+        contents = search_function(query_vector.tolist(), k, max_distance, user_id, options)
+        return time.perf_counter() - started, contents
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(timed, queries))
+
+
+async def run_http(
+        url: str,
+        queries: np.ndarray,
+        k: int,
+        max_distance: float,
+        concurrency: int,
+        user_id: str,
+        options: dict,
+):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed(client: httpx.AsyncClient, query_vector: np.ndarray):
+        payload = {
+            "queries": [{"vector": query_vector.tolist(), "limit": k, "max_distance": max_distance}],
+            "user_id": user_id,
+            **options,
+        }
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post(f"{url}/search/batch", json=payload)
+            elapsed = time.perf_counter() - started
+        response.raise_for_status()
+        items = response.json()["results"][0]["items"]
+        return elapsed, [item["memory"]["content"] for item in items]
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=None) as client:
+        return await asyncio.gather(*(timed(client, query_vector) for query_vector in queries))
+
+
+def table_bytes() -> int:
+    with engine.connect() as connection:
+        return connection.execute(text("SELECT pg_total_relation_size('history')")).scalar_one()
+
+
+def run_benchmark(
+        size: int,
+        seed: int,
+        target: str = "function",
+        url: str = "http://localhost:8000",
+        query_set_name: str = "synthetic",
+        query_count: int = 100,
+        k: int = 10,
+        max_distance: float = 30.0,
+        concurrency: int = 1,
+        warmup: int = 5,
+        options: dict | None = None,
+) -> dict:
+    options = {name: value for name, value in (options or {}).items() if value is not None}
+    queries = query_set(query_set_name, query_count, seed)
+    # searches only see the corpus rows, so the brute force ground truth covers everything they can return
+    user_id = corpus_user(seed)
+
+    def replay(batch: np.ndarray):
+        if target == "function":
+            return run_function(batch, k, max_distance, concurrency, user_id, options)
+        if target == "http":
+            return asyncio.run(run_http(url, batch, k, max_distance, concurrency, user_id, options))
+        raise ValueError(f"unknown benchmark target: {target}")
+
+    if warmup:
+        replay(queries[:warmup])
+
+    started = time.perf_counter()
+    measurements = replay(queries)
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for latency, _ in measurements]
+    retrieved = [
+        [index for index in (index_from_content(content, seed) for content in contents) if index is not None]
+        for _, contents in measurements
+    ]
+    truth = ground_truth(queries, size, seed, k, max_distance)
+
+    return {
+        "git_commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "params": {
+            "size": size,
+            "seed": seed,
+            "user_id": user_id,
+            "target": target,
+            "query_set": query_set_name,
+            "queries": query_count,
+            "k": k,
+            "max_distance": max_distance,
+            "concurrency": concurrency,
+            **options,
+        },
+        "latency_ms": latency_summary(latencies),
+        "qps": query_count / elapsed,
+        "recall_at_k": recall_at_k(retrieved, truth, k),
+        "memory": {
+            # ru_maxrss is reported in KiB on linux
+            "client_max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            "history_table_bytes": table_bytes(),
+        },
+    }
+
+
+def compare(baseline: dict, current: dict, max_latency_regression: float, max_recall_drop: float) -> list[str]:
+    problems = []
+    for percentile in ("p50", "p95", "p99"):
+        before, after = baseline["latency_ms"][percentile], current["latency_ms"][percentile]
+        if after > before * (1 + max_latency_regression):
+            problems.append(f"{percentile} latency {before:.2f}ms -> {after:.2f}ms")
+
+    if current["qps"] < baseline["qps"] * (1 - max_latency_regression):
+        problems.append(f"qps {baseline['qps']:.1f} -> {current['qps']:.1f}")
+
+    before, after = baseline["recall_at_k"], current["recall_at_k"]
+    if before is not None and after is not None and after < before - max_recall_drop:
+        problems.append(f"recall@k {before:.4f} -> {after:.4f}")
+    return problems
@@ -0,0 +1,21 @@
+import numpy as np
+
+from bench.corpus import CHUNK_ROWS, centroids, corpus_chunks, ground_truth, sample_vectors
+
+
+def test_ground_truth_matches_brute_force():
+    size, seed, k, dimensions = CHUNK_ROWS + 500, 7, 5, 8
+    queries = sample_vectors(np.random.default_rng(1), centroids(seed, dimensions), 4)
+    corpus = np.concatenate([vectors for _, vectors in corpus_chunks(size, seed, dimensions=dimensions)])
+
+    normalized = corpus / np.linalg.norm(corpus, axis=1, keepdims=True)
+    distances = 1 - (queries / np.linalg.norm(queries, axis=1, keepdims=True)) @ normalized.T
+    expected = np.argsort(distances, axis=1, kind="stable")[:, :k].tolist()
+
+    assert len(corpus) == size
+    assert ground_truth(queries, size, seed, k, max_distance=30.0) == expected
+
+
+def test_ground_truth_respects_max_distance():
+    queries = sample_vectors(np.random.default_rng(1), centroids(3, 8), 2)
+    assert ground_truth(queries, 100, 3, 5, max_distance=-1.0) == [[], []]
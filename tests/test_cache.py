@@ -0,0 +1,69 @@
+import numpy as np
+
+from api import cache
+from api.cache import MemoryCacheBackend, SearchResultCache, SQLiteCacheBackend
+
+
+def test_memory_cache_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_entries=2, ttl=60)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    assert backend.get("a") == 1
+
+    backend.set("c", 3)
+
+    assert backend.get("b") is None
+    assert (backend.get("a"), backend.get("c")) == (1, 3)
+    assert backend.stats.evictions == 1
+    assert len(backend) == 2
+
+
+def test_memory_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    backend = MemoryCacheBackend(max_entries=10, ttl=5)
+    backend.set("a", 1)
+
+    now[0] = 104.0
+    assert backend.get("a") == 1
+    now[0] = 106.0
+    assert backend.get("a") is None
+    assert len(backend) == 0
+    assert (backend.stats.hits, backend.stats.misses) == (1, 1)
+
+
+def test_search_key_changes_when_history_is_written():
+    results = SearchResultCache(MemoryCacheBackend(max_entries=10, ttl=60))
+    key = results.key([0.1, 0.2], 10, 0.5, mode="hnsw")
+
+    assert results.key([0.1, 0.2], 10, 0.5, mode="hnsw") == key
+    assert results.key([0.1, 0.2], 10, 0.5, mode="exact") != key
+    assert results.key([0.1, 0.2], 11, 0.5, mode="hnsw") != key
+
+    results.set(key, [("id", "content", 0.25)])
+    results.invalidate()
+    assert results.key([0.1, 0.2], 10, 0.5, mode="hnsw") != key
+    assert results.get(key) is None
+
+
+def test_sqlite_cache_round_trip(tmp_path):
+    path = str(tmp_path / "cache" / "cache.sqlite3")
+    backend = SQLiteCacheBackend(path, "search", max_entries=2, ttl=60)
+    vector = np.arange(3, dtype=np.float32)
+
+    backend.set("json", [["id", "content", 0.25]])
+    backend.set("bytes", vector.tobytes())
+    assert backend.get("json") == [["id", "content", 0.25]]
+    assert np.array_equal(np.frombuffer(backend.get("bytes"), dtype=np.float32), vector)
+
+    # another worker on the same file sees the entries and the generation bump
+    other = SQLiteCacheBackend(path, "search", max_entries=2, ttl=60)
+    assert other.get("json") == [["id", "content", 0.25]]
+    other.invalidate()
+    assert backend.generation() == 1
+    assert backend.get("json") is None
+
+    backend.set("a", 1)
+    backend.set("b", 2)
+    backend.set("c", 3)
+    assert len(backend) == 2
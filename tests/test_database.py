@@ -0,0 +1,60 @@
+import pytest
+
+from api.database import (
+    HNSW_MAX_EF_SEARCH,
+    VECTOR_DIMENSIONS,
+    MemoryFilter,
+    build_batch_distance_query,
+    group_batch_rows,
+    hnsw_candidates,
+    search_mode,
+)
+
+
+def test_search_mode_validates_and_caps_hnsw():
+    assert search_mode("exact", 10) == "exact"
+    assert search_mode("hnsw", HNSW_MAX_EF_SEARCH) == "hnsw"
+    # an hnsw scan can't return more than ef_search rows
+    assert search_mode("hnsw", HNSW_MAX_EF_SEARCH + 1) == "exact"
+    with pytest.raises(ValueError):
+        search_mode("ivfflat", 10)
+
+
+def test_hnsw_candidates_oversample_within_ef_search():
+    assert hnsw_candidates(10, 4) == 40
+    assert hnsw_candidates(10, 0.5) == 10
+    assert hnsw_candidates(10, 1.25) == 13
+    assert hnsw_candidates(500, 4) == HNSW_MAX_EF_SEARCH
+
+
+def test_batch_query_keeps_a_bounded_top_k_per_query():
+    vectors = [[0.0] * VECTOR_DIMENSIONS, [1.0] * VECTOR_DIMENSIONS]
+    exact = build_batch_distance_query(vectors, [5, 7], [0.5, 30.0], "exact", 4)
+    sql = str(exact)
+
+    assert "CROSS JOIN LATERAL" in sql
+    assert "ORDER BY rank LIMIT q.max_rows" in sql
+    assert "row_number()" not in sql
+    assert {name: exact.compile().params[name] for name in ("limit_0", "limit_1", "max_distance_0")} == {
+        "limit_0": 5, "limit_1": 7, "max_distance_0": 0.5,
+    }
+
+    hnsw = build_batch_distance_query(vectors, [5, 300], [0.5, 30.0], "hnsw", 4)
+    assert "LIMIT q.candidates" in str(hnsw)
+    assert f"::halfvec({VECTOR_DIMENSIONS})" in str(hnsw)
+    assert (hnsw.compile().params["candidates_0"], hnsw.compile().params["candidates_1"]) == (20, HNSW_MAX_EF_SEARCH)
+
+
+def test_batch_query_binds_filters_and_recency():
+    filters = MemoryFilter(user_id="u1", last_turns=3)
+    query = build_batch_distance_query([[0.0] * VECTOR_DIMENSIONS], [5], [30.0], "exact", 4, filters, 0.2, 60.0)
+    params = query.compile().params
+
+    assert (params["filter_user_id"], params["filter_last_turns"]) == ("u1", 3)
+    assert (params["recency_weight"], params["recency_half_life"]) == (0.2, 60.0)
+    assert "filter_conversation_id" not in params
+
+
+def test_group_batch_rows_keeps_order_and_empty_groups():
+    rows = [(0, "a", "A", 0.1), (0, "b", "B", 0.2), (2, "c", "C", 0.3)]
+    assert group_batch_rows(rows, 3) == [[("a", "A", 0.1), ("b", "B", 0.2)], [], [("c", "C", 0.3)]]
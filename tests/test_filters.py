@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from api.database import MemoryFilter, filter_clauses, hnsw_setup_statement, search_mode
+from api.main import make_filter
+
+
+def compiled(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_make_filter_reads_naive_timestamps_as_utc():
+    since = datetime(2024, 1, 1, 12)
+    until = datetime(2024, 1, 2, tzinfo=timezone(timedelta(hours=-3)))
+
+    filters = make_filter("u1", None, since, until, None)
+
+    assert filters.since == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    assert filters.until == until
+    assert make_filter(None, None, None, None, None) is None
+
+
+def test_filter_clauses():
+    assert filter_clauses(None) == []
+
+    since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    clauses = [compiled(clause) for clause in filter_clauses(MemoryFilter(user_id="u1", conversation_id="c1", since=since))]
+    assert clauses == [
+        "history.user_id = 'u1'",
+        "history.conversation_id = 'c1'",
+        "history.created_at >= '2024-01-01 00:00:00+00:00'",
+    ]
+
+    conversation, last_turns = filter_clauses(MemoryFilter(conversation_id="c1", last_turns=3))
+    sql = compiled(last_turns)
+    assert compiled(conversation) == "history.conversation_id = 'c1'"
+    # the newest N rows are picked among the ones matching the other filters
+    assert sql.startswith("history.id IN (SELECT history_1.id")
+    assert "history_1.conversation_id = 'c1'" in sql
+    assert "ORDER BY history_1.created_at DESC" in sql and "LIMIT 3" in sql
+
+
+def test_selective_filters_search_exactly():
+    assert search_mode("hnsw", 10, MemoryFilter(conversation_id="c1")) == "exact"
+    assert search_mode("hnsw", 10, MemoryFilter(user_id="u1", last_turns=5)) == "exact"
+    assert search_mode("hnsw", 10, MemoryFilter(user_id="u1")) == "hnsw"
+
+
+def test_filtered_hnsw_scans_iterate():
+    assert "hnsw.iterative_scan" not in compiled(hnsw_setup_statement(100))
+    assert "hnsw.iterative_scan" not in compiled(hnsw_setup_statement(100, MemoryFilter()))
+    assert "set_config('hnsw.iterative_scan'" in compiled(hnsw_setup_statement(100, MemoryFilter(user_id="u1")))
@@ -0,0 +1,76 @@
+import struct
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from api.database import DEFAULT_USER_ID
+from api.ingest import IngestError, IngestReport, IngestRow, encode_copy_batch, read_rows
+
+
+def read_field(data: bytes, offset: int) -> tuple[bytes | None, int]:
+    (length,) = struct.unpack_from("!i", data, offset)
+    offset += 4
+    if length == -1:
+        return None, offset
+    return data[offset:offset + length], offset + length
+
+
+def test_encode_copy_batch_layout():
+    created_at = datetime(2000, 1, 2, 0, 0, 1, 5, tzinfo=timezone.utc)
+    rows = [IngestRow("olá", user_id="u1", created_at=created_at)]
+    vectors = np.array([[1.5, -2.0, 0.25]], dtype=np.float32)
+
+    data = encode_copy_batch(["01ID"], rows, vectors)
+
+    assert data.startswith(b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0))
+    assert data.endswith(struct.pack("!h", -1))
+
+    offset = 19
+    assert struct.unpack_from("!h", data, offset) == (6,)
+    offset += 2
+    memory_id, offset = read_field(data, offset)
+    user_id, offset = read_field(data, offset)
+    conversation_id, offset = read_field(data, offset)
+    timestamp, offset = read_field(data, offset)
+    content, offset = read_field(data, offset)
+    vector, offset = read_field(data, offset)
+
+    assert (memory_id, user_id, conversation_id) == (b"01ID", b"u1", None)
+    # microseconds since 2000-01-01 UTC, not the unix epoch
+    assert struct.unpack("!q", timestamp) == ((24 * 3600 + 1) * 1_000_000 + 5,)
+    assert content.decode() == "olá"
+    assert struct.unpack("!HH3f", vector) == (3, 0, 1.5, -2.0, 0.25)
+    assert offset == len(data) - 2
+
+
+def test_read_rows_parses_records():
+    report = IngestReport()
+    lines = [
+        '{"content": "a", "user_id": "u1", "conversation_id": "c1", "created_at": "2024-01-01T00:00:00"}',
+        "",
+        '{"title": "t", "body": "b"}',
+        '{"user_id": "u1"}',
+    ]
+
+    rows = list(read_rows(lines, report))
+
+    assert rows == [
+        IngestRow("a", "u1", "c1", datetime(2024, 1, 1, tzinfo=timezone.utc)),
+        IngestRow("t\n\nb", DEFAULT_USER_ID),
+    ]
+    assert report.skipped == 1
+
+
+@pytest.mark.parametrize("line", [
+    "{not json",
+    "[1, 2]",
+    '{"content": 5}',
+    '{"content": "x", "user_id": 7}',
+    '{"content": "x", "conversation_id": {}}',
+    '{"content": "x", "created_at": "yesterday"}',
+    '{"title": ["t"]}',
+])
+def test_read_rows_rejects_malformed_records(line):
+    with pytest.raises(IngestError, match="line 2"):
+        list(read_rows(['{"content": "ok"}', line], IngestReport()))
@@ -0,0 +1,33 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from api.database import VECTOR_DIMENSIONS
+from api.main import app
+
+# no `with`: the lifespan would connect to postgres, and these requests are rejected before reaching it
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("params", [
+    {"mode": "ivfflat"},
+    {"limit": 0},
+    {"mode": "hnsw", "oversampling": "inf"},
+    {"mode": "hnsw", "oversampling": "nan"},
+    {"mode": "hnsw", "oversampling": 0.5},
+    {"mode": "hnsw", "ef_search": 0},
+    {"mode": "hnsw", "ef_search": 1001},
+])
+@pytest.mark.parametrize("path", ["/test-distance", "/test-distance/stream"])
+def test_search_parameters_are_validated(path, params):
+    assert client.get(path, params=params).status_code == 422
+
+
+@pytest.mark.parametrize("options", [
+    {"mode": "ivfflat"},
+    {"oversampling": 0.5},
+    {"ef_search": 0},
+    {"ef_search": 1001},
+])
+def test_batch_search_options_are_validated(options):
+    payload = {"queries": [{"vector": [0.0] * VECTOR_DIMENSIONS}], **options}
+    assert client.post("/search/batch", json=payload).status_code == 422
@@ -0,0 +1,17 @@
+from api.metrics import Histogram
+
+
+def test_histogram_render_is_cumulative():
+    histogram = Histogram("request_seconds", "Request latency", (0.1, 1.0), ("route",))
+    for value in (0.05, 0.5, 2.0):
+        histogram.observe(value, "/a")
+
+    assert list(histogram.render()) == [
+        "# HELP request_seconds Request latency",
+        "# TYPE request_seconds histogram",
+        'request_seconds_bucket{route="/a",le="0.1"} 1',
+        'request_seconds_bucket{route="/a",le="1.0"} 2',
+        'request_seconds_bucket{route="/a",le="+Inf"} 3',
+        'request_seconds_count{route="/a"} 3',
+        'request_seconds_sum{route="/a"} 2.55',
+    ]
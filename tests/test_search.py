@@ -0,0 +1,103 @@
+import asyncio
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+
+from api import search
+from api.database import MemoryFilter
+from api.search import NumpyStore
+
+
+def make_store() -> NumpyStore:
+    store = NumpyStore(np.dtype("float32"), None, dimensions=2, initial_capacity=2)
+    store.add(
+        ["a", "b", "c", "d"],
+        ["A", "B", "C", "D"],
+        np.array([[1, 0], [0, 1], [1, 1], [0, 0]], dtype=np.float32),
+        user_ids=["u1", "u1", "u2", "u1"],
+        conversation_ids=["c1", "c1", None, "c1"],
+        created_at=[10.0, 20.0, 30.0, 40.0],
+    )
+    return store
+
+
+def test_top_k_orders_by_distance_and_drops_zero_vectors():
+    store = make_store()
+    distances = store.distances(store.size, np.array([[1, 0]], dtype=np.float32))[0]
+
+    hits = store.top_k(distances, limit=2, max_distance=2.0)
+    assert [hit.id for hit in hits] == ["a", "c"]
+
+    hits = store.top_k(distances, limit=10, max_distance=0.5)
+    assert [hit.id for hit in hits] == ["a", "c"]
+    assert "d" not in [hit.id for hit in store.top_k(distances, limit=10, max_distance=30.0)]
+
+
+def test_mask_applies_filters():
+    store = make_store()
+    since = datetime.fromtimestamp(15, timezone.utc)
+
+    assert store.mask(store.size, None) is None
+    assert store.mask(store.size, MemoryFilter(user_id="u1")).tolist() == [True, True, False, True]
+    assert store.mask(store.size, MemoryFilter(user_id="u1", since=since)).tolist() == [False, True, False, True]
+    assert store.mask(store.size, MemoryFilter(conversation_id="c1", last_turns=2)).tolist() == [False, True, False, True]
+    assert store.mask(store.size, MemoryFilter(user_id="u2", last_turns=5)).tolist() == [False, False, True, False]
+
+
+class FakeResult:
+    def __init__(self, ids):
+        self.ids = ids
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.ids
+
+
+class FakeSession:
+    def __init__(self, ids):
+        self.ids = ids
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, statement):
+        return FakeResult(self.ids)
+
+
+def test_refresh_invalidates_search_cache_only_when_rows_are_loaded(monkeypatch):
+    ids = ["01A"]
+    invalidations = []
+    monkeypatch.setattr(search, "AsyncSessionLocal", lambda: FakeSession(ids))
+    monkeypatch.setattr(search, "invalidate_search_cache", lambda: invalidations.append(True))
+
+    backend = search.NumpyBackend(mmap_path=None, dimensions=2)
+
+    async def load_rows(session, store, missing):
+        store.add(missing, missing, np.ones((len(missing), 2), dtype=np.float32))
+
+    monkeypatch.setattr(backend, "load_rows", load_rows)
+
+    asyncio.run(backend.refresh())
+    assert backend.size == 1 and len(invalidations) == 1
+
+    asyncio.run(backend.refresh())
+    assert len(invalidations) == 1
+
+    ids.append("01B")
+    asyncio.run(backend.refresh())
+    assert backend.size == 2 and len(invalidations) == 2
+
+
+def test_mmap_file_is_per_process(tmp_path):
+    path = str(tmp_path / "matrix")
+    backend = search.NumpyBackend(mmap_path=path, dimensions=2)
+
+    assert backend.mmap_path == f"{path}.{os.getpid()}"
+    assert os.path.exists(backend.mmap_path)
+    assert not os.path.exists(path)